@@ -4,6 +4,7 @@ from collections.abc import Callable, Generator
 from typing import TypeVar, TypeAlias, Type, Optional, Any, Tuple, List
 
 from mafunca.common.exceptions import MonadError
+import mafunca.common._panics as panics # noqa
 
 
 def panic_on_violations(monad_name: str, runner_name: str, entity):
@@ -19,24 +20,20 @@ def panic_on_violations(monad_name: str, runner_name: str, entity):
     )
 
 
-def _extract_name(func) -> str:
-    return getattr(func, "__qualname__", getattr(func, "__name__", f"{func}"))
-
-
 def panic_on_coroutine(fn: Callable, monad_name: str, method_name: str):
     """
        Internal.
        Panic when the monadic contract is violated - function must be sync.
        :raises MonadError: async function can not be used
     """
-    is_coro = inspect.iscoroutinefunction(fn)
+    is_coro = panics.flags(fn) & panics.IS_COROUTINE
     if not is_coro:
         is_coro = inspect.iscoroutinefunction(getattr(fn, "__call__", None))
     if is_coro:
         raise MonadError(
             monad=monad_name,
             method=method_name,
-            message=f"function '{_extract_name(fn)}' - async function can not be used"
+            message=f"function '{panics.extract_name(fn)}' - async function can not be used"
         )
 
 
@@ -0,0 +1,67 @@
+from typing import Dict, Tuple
+from collections.abc import Callable
+
+import mafunca.common._panics as panics  # noqa
+import mafunca.common._shared as shared  # noqa
+
+
+_FACTORIES: Dict[Tuple[str, bool, bool, bool, bool], Callable] = dict()
+
+
+def _source(kind: str, effect_is_coro: bool, fn_is_coro: bool, maybe_bad: bool, check_contract: bool) -> str:
+    """
+        Source code of a step factory without branches on the flags known at build time.
+        The panic helpers are called only when the inline check fails.
+    """
+    body = []
+    if effect_is_coro:
+        body += ["previous = await effect()"]
+    else:
+        body += ["previous = effect()", "if isawaitable(previous):", "    previous = await previous"]
+    if maybe_bad:
+        body += ["if bad_evaluator(previous):", "    return previous"]
+    if fn_is_coro:
+        body += ["current = await fn(previous)"]
+    else:
+        body += ["current = fn(previous)", "if isawaitable(current):", "    current = await current"]
+    if kind == 'map':
+        if check_contract:
+            body += [
+                "if isinstance(current, monad):",
+                "    panics.on_monadic_result(current, fn=fn, monad=monad, method=method)"
+            ]
+    else:
+        if check_contract:
+            body += [
+                "if current.__class__ is not monad:",
+                "    panics.on_another_instance(current, fn=fn, monad=monad, method=method)"
+            ]
+        body += ["current = current.effect()", "if isawaitable(current):", "    current = await current"]
+    body += ["return current"]
+
+    lines = [f"def make_{kind}(effect, fn, monad, method, bad_evaluator):", "    async def new_effect():"]
+    lines += [f"        {line}" for line in body]
+    lines += ["    return new_effect"]
+    return "\n".join(lines) + "\n"
+
+
+def step_factory(
+    kind: str,
+    effect_is_coro: bool,
+    fn_is_coro: bool,
+    maybe_bad: bool,
+    check_contract: bool
+) -> Callable[[Callable, Callable, type, str, Callable[..., bool]], Callable]:
+    """
+        Factory of 'map' or 'bind' step closures for Eff, specialized by the flags.
+        The source is generated and compiled once per combination of flags.
+    """
+    key = (kind, effect_is_coro, fn_is_coro, maybe_bad, check_contract)
+    factory = _FACTORIES.get(key)
+    if factory is None:
+        source = _source(*key)
+        flags = "".join(str(int(flag)) for flag in key[1:])
+        filename = f"<mafunca-eff-{kind}-{flags}>"
+        namespace = shared.compile_factory(source, filename, {'isawaitable': panics.isawaitable, 'panics': panics})
+        factory = _FACTORIES[key] = namespace[f"make_{kind}"]
+    return factory
@@ -1,12 +1,101 @@
 import inspect
-from collections.abc import Callable
+from collections.abc import Callable, Awaitable
+from functools import partial
+from types import CoroutineType, FunctionType, GeneratorType
 from typing import Optional
+from weakref import WeakKeyDictionary
 
 from mafunca.common.exceptions import MonadError, CurryBadFunctionError
 
 
 def extract_name(func) -> str:
-    return getattr(func, "__qualname__", getattr(func, "__name__", f"{func}"))
+    # the fallbacks are computed only when needed, not eagerly as getattr defaults
+    try:
+        return func.__qualname__
+    except AttributeError:
+        try:
+            return func.__name__
+        except AttributeError:
+            return f"{func}"
+
+
+IS_COROUTINE = 1
+IS_FUNCTION = 2
+IS_BUILTIN = 4
+IS_METHOD = 8
+
+_FLAGS: WeakKeyDictionary[Callable, int] = WeakKeyDictionary()
+
+
+def _inspect_flags(fn) -> int:
+    return (
+        (IS_COROUTINE if inspect.iscoroutinefunction(fn) else 0)
+        | (IS_FUNCTION if inspect.isfunction(fn) else 0)
+        | (IS_BUILTIN if inspect.isbuiltin(fn) else 0)
+        | (IS_METHOD if inspect.ismethod(fn) else 0)
+    )
+
+
+def flags(fn) -> int:
+    """
+        Packed results of 'inspect' checks for the callable.
+        Plain functions are checked directly - a cache entry costs more than the check for a fresh lambda.
+        Other callables are computed once.
+    """
+    cls = fn.__class__
+    if cls is FunctionType:
+        return IS_FUNCTION | (IS_COROUTINE if inspect.iscoroutinefunction(fn) else 0)
+    if cls is partial:
+        # inspect looks through partial objects for coroutine functions only, the rest is false for them
+        return flags(fn.func) & IS_COROUTINE
+    try:
+        result = _FLAGS.get(fn)
+        if result is None:
+            result = _FLAGS[fn] = _inspect_flags(fn)
+        return result
+    except TypeError:  # unhashable or does not support weak references
+        return _inspect_flags(fn)
+
+
+_RETURN_TYPES: WeakKeyDictionary[Callable, Optional[type]] = WeakKeyDictionary()
+
+
+def _inspect_return_type(fn) -> Optional[type]:
+    annotations = getattr(fn, "__annotations__", None)
+    if not isinstance(annotations, dict):
+        return None
+    annotation = annotations.get("return")
+    # only a plain class is trusted: strings, generics, unions and awaitables can hide anything
+    if isinstance(annotation, type) and not issubclass(annotation, Awaitable):
+        return annotation
+    return None
+
+
+def return_type(fn) -> Optional[type]:
+    """The plain class from the return annotation of the callable or None - computed once per callable"""
+    try:
+        return _RETURN_TYPES[fn]
+    except KeyError:
+        result = _RETURN_TYPES[fn] = _inspect_return_type(fn)
+        return result
+    except TypeError:  # unhashable or does not support weak references
+        return _inspect_return_type(fn)
+
+
+def is_unrelated_result(fn, monad) -> bool:
+    """The annotated result of the function can not be an instance of the monad - the contract check is redundant"""
+    annotated = return_type(fn)
+    return annotated is not None and not issubclass(annotated, monad) and not issubclass(monad, annotated)
+
+
+def isawaitable(obj) -> bool:
+    """'inspect.isawaitable' without the walk through the ABC machinery for the usual objects"""
+    cls = obj.__class__
+    if cls is CoroutineType or getattr(cls, "__await__", None) is not None:
+        return True
+    if cls is GeneratorType:  # generator-based coroutine, decided by the code flags
+        return inspect.isawaitable(obj)
+    return False
 
 
 def on_coroutine(fn: Callable, monad_name: str, method: str):
@@ -14,7 +103,7 @@ def on_coroutine(fn: Callable, monad_name: str, method: str):
        Panic when the monadic contract is violated - function must be sync.
        :raises MonadError:
     """
-    if inspect.iscoroutinefunction(fn):
+    if flags(fn) & IS_COROUTINE:
         raise MonadError(
             monad_name,
             method,
@@ -27,7 +116,7 @@ def on_sync(fn: Callable, monad_name: str, method: str):
        Panic when the monadic contract is violated - function must be async.
        :raises MonadError:
     """
-    if not inspect.iscoroutinefunction(fn):
+    if not flags(fn) & IS_COROUTINE:
         raise MonadError(
             monad_name,
             method,
@@ -53,7 +142,7 @@ def on_another_instance(result, fn: Callable, monad, method: str):
        Panic when the monadic contract is violated - the function should return the same instance.
        :raises MonadError:
     """
-    if not isinstance(result, monad):
+    if result.__class__ is not monad and not isinstance(result, monad):
         name = monad.__name__
         raise MonadError(
             name,
@@ -83,33 +172,10 @@ def on_bad_curried(func):
        Panic on improper entity for currying.
        :raises CurryBadFunctionError:
     """
-    if not inspect.isfunction(func):
-        raise CurryBadFunctionError(func_name=extract_name(func), err="must be a callable")
-    if inspect.isbuiltin(func):
+    if not callable(func):
+        raise CurryBadFunctionError(func_name=extract_name(func), err="must be a callable object")
+    func_flags = flags(func)
+    if func_flags & IS_BUILTIN:
         raise CurryBadFunctionError(func_name=extract_name(func), err="should not be a built-in function")
-    if inspect.ismethod(func):
+    if func_flags & IS_METHOD:
         raise CurryBadFunctionError(func_name=extract_name(func), err="should not be a bound method")
-
-
-def curry_on_coroutine(func: Callable):
-    """
-       Panic on async function in sync curry decorator.
-       :raises CurryBadFunctionError:
-    """
-    if inspect.iscoroutinefunction(func):
-        raise CurryBadFunctionError(
-            func_name=extract_name(func),
-            err="should not be an async function. Use async curry decorator instead."
-        )
-
-
-def curry_on_sync(func: Callable):
-    """
-       Panic on sync function in async curry decorator.
-       :raises CurryBadFunctionError:
-    """
-    if not inspect.iscoroutinefunction(func):
-        raise CurryBadFunctionError(
-            func_name=extract_name(func),
-            err="should not be a sync function. Use sync curry decorator instead."
-        )
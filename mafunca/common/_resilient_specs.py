@@ -1,8 +1,8 @@
 from typing import TypeVar, Union, Optional, List, Tuple
-import inspect
 from collections.abc import Callable, Awaitable
 
 from mafunca.common.resilient_support import Uncaught
+import mafunca.common._panics as panics # noqa
 
 
 _ORIGIN_LINK = "__mafunca_resilient_origin__"
@@ -47,7 +47,7 @@ T = TypeVar('T')
 
 
 async def maybe_await(obj: Union[Awaitable[T], T]) -> T:
-    return await obj if inspect.isawaitable(obj) else obj
+    return await obj if panics.isawaitable(obj) else obj
 
 
 def continuer(fn: Callable, bad_evaluator: Callable[..., bool]) -> Callable[..., Awaitable]:
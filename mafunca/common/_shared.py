@@ -0,0 +1,20 @@
+from typing import TypeVar, Dict, Any
+import linecache
+
+
+_T = TypeVar('_T')
+
+
+def const(value: _T) -> _T:
+    """Effect of a value known in advance - a shared function instead of a new lambda per value"""
+    return value
+
+
+def compile_factory(source: str, filename: str, namespace: Dict[str, Any]) -> Dict[str, Any]:
+    """
+        Executes the generated source in the namespace and returns it.
+        The source is registered in linecache under the filename - tracebacks show the generated lines.
+    """
+    linecache.cache[filename] = (len(source), None, source.splitlines(keepends=True), filename)
+    exec(compile(source, filename, 'exec'), namespace)
+    return namespace
@@ -0,0 +1,70 @@
+from typing import Dict, Optional
+from collections.abc import Callable
+from types import FunctionType
+
+import mafunca.common._shared as shared  # noqa
+
+
+MAX_ARITY = 8  # wrappers are generated for the functions with up to this number of positional parameters
+
+_FACTORIES: Dict[int, Callable] = dict()
+
+
+def closer_arity(func) -> Optional[int]:
+    """
+        Number of the positional parameters of a plain function, if a specialized wrapper is suitable for it.
+        Otherwise - None.
+    """
+    if func.__class__ is not FunctionType:
+        return None
+    arity = func.__code__.co_argcount
+    return arity if 0 < arity <= MAX_ARITY else None
+
+
+def _source(arity: int) -> str:
+    """
+        Source code of a 'closer' wrapper factory with the checks unrolled for each positional argument.
+        Only generated names are used - the parameters of the decorated function can not shadow anything.
+        Calls with named arguments or another number of positional ones go to the generic wrapper.
+    """
+    names = [f"_arg{index}" for index in range(arity)]
+    body = [
+        f"if kwargs or len(args) != {arity}:",
+        "    return _generic(*args, **kwargs)",
+        f"{', '.join(names)}, = args",
+    ]
+    for name in names:
+        body += [
+            f"_cls = {name}.__class__",
+            "if _cls is _right_cls:",
+            f"    {name} = {name}._value",
+            "elif _cls in _bad_types:",
+            f"    return {name}",
+            f"elif _isinstance({name}, _triple):",
+            f"    if not {name}.is_right:",
+            f"        return {name}",
+            f"    {name} = {name}.value",
+        ]
+    body += [f"return _func({', '.join(names)})"]
+
+    lines = [
+        "def make_closer(_func, _generic, _right_cls, _bad_types, _triple, _isinstance):",
+        "    def closer_wrapper(*args, **kwargs):",
+    ]
+    lines += [f"        {line}" for line in body]
+    lines += ["    return closer_wrapper"]
+    return "\n".join(lines) + "\n"
+
+
+def closer_factory(arity: int) -> Callable[[Callable, Callable, type, frozenset, type, Callable], Callable]:
+    """
+        Factory of 'closer' wrappers for functions with the given number of positional parameters.
+        The source is generated and compiled once per arity - at most MAX_ARITY of them.
+    """
+    factory = _FACTORIES.get(arity)
+    if factory is None:
+        source = _source(arity)
+        filename = f"<mafunca-closer-{arity}>"
+        namespace = shared.compile_factory(source, filename, dict())
+        factory = _FACTORIES[arity] = namespace["make_closer"]
+    return factory
@@ -1,9 +1,13 @@
 import inspect
 from collections.abc import Callable
-from functools import wraps
-from typing import TypeVar, Union
+from dataclasses import dataclass
+from functools import wraps, WRAPPER_ASSIGNMENTS
+from types import MethodType
+from typing import TypeVar, Union, Optional, Any, Tuple, Dict, FrozenSet
+from weakref import WeakKeyDictionary
 
 from mafunca.common.exceptions import CurryBadFunctionError, CurryBadArguments
+import mafunca.common._panics as panics # noqa
 
 
 __all__ = [
@@ -74,53 +78,196 @@ def curry4(fn: Callable[[A, B, C, D], R]) -> Callable[[A], Callable[[B], Callabl
     return curry4_step1
 
 
-def _extract_name(func) -> str:
-    return getattr(func, "__qualname__", getattr(func, "__name__", f"{func}"))
-
-
-def _panic_on_bad_curried(func):
+_KIND = inspect.Parameter
+
+
+@dataclass(frozen=True, slots=True)
+class _ParamPlan:
+    """Parameters of the function for currying, prepared once for hand-written partial binding"""
+    names: Tuple[str, ...]
+    positional_names: Tuple[str, ...]
+    keyword_names: FrozenSet[str]
+    kw_only_names: Tuple[str, ...]
+    defaults: Dict[str, Any]
+    var_pos: Optional[str]
+    var_kw: Optional[str]
+
+    @staticmethod
+    def of(sig: inspect.Signature) -> '_ParamPlan':
+        positional_names, keyword_names, kw_only_names = [], [], []
+        defaults, var_pos, var_kw = dict(), None, None
+        for name, par in sig.parameters.items():  # a single pass over the signature
+            kind = par.kind
+            if kind is _KIND.VAR_POSITIONAL:
+                var_pos = name
+                continue
+            if kind is _KIND.VAR_KEYWORD:
+                var_kw = name
+                continue
+            if kind is not _KIND.KEYWORD_ONLY:
+                positional_names.append(name)
+            if kind is not _KIND.POSITIONAL_ONLY:
+                keyword_names.append(name)
+            if kind is _KIND.KEYWORD_ONLY:
+                kw_only_names.append(name)
+            if par.default is not _KIND.empty:
+                defaults[name] = par.default
+        return _ParamPlan(
+            names=tuple(sig.parameters),
+            positional_names=tuple(positional_names),
+            keyword_names=frozenset(keyword_names),
+            kw_only_names=tuple(kw_only_names),
+            defaults=defaults,
+            var_pos=var_pos,
+            var_kw=var_kw,
+        )
+
+
+_PLAN_CACHE: WeakKeyDictionary[Callable, _ParamPlan] = WeakKeyDictionary()
+
+
+def _plan(func) -> _ParamPlan:
     """
-       Panic on improper entity for currying.
-       :raises CurryBadFunctionError:
+       Parameter plan of the function for currying - introspected once per function.
+       :raises CurryBadFunctionError: signature can not be obtained
     """
-    if not callable(func):
-        raise CurryBadFunctionError(func_name=_extract_name(func), err="must be a callable object")
-    if inspect.isbuiltin(func):
-        raise CurryBadFunctionError(func_name=_extract_name(func), err="should not be a built-in function")
-    if inspect.ismethod(func):
-        raise CurryBadFunctionError(func_name=_extract_name(func), err="should not be a bound method")
-
-
-def _apply(sig: inspect.Signature, *args, **kwargs) -> inspect.BoundArguments:
+    try:
+        plan = _PLAN_CACHE.get(func)
+    except TypeError:  # the object does not support weak references
+        return _ParamPlan.of(_introspect(func))
+    if plan is None:
+        plan = _PLAN_CACHE[func] = _ParamPlan.of(_introspect(func))
+    return plan
+
+
+def _introspect(func) -> inspect.Signature:
+    try:
+        return inspect.signature(func)
+    except ValueError as err:
+        raise CurryBadFunctionError(func_name=panics.extract_name(func), err=str(err)) from None
+
+
+def _metadata(fn) -> Dict[str, Any]:
+    """Attributes copied by 'functools.wraps' - collected once per curried function instead of once per step"""
+    metadata = dict()
+    for attr in WRAPPER_ASSIGNMENTS:
+        try:
+            metadata[attr] = getattr(fn, attr)
+        except AttributeError:
+            pass
+    return metadata
+
+
+def _apply(
+    plan: _ParamPlan,
+    bound: Dict[str, Any],
+    free: Tuple[str, ...],
+    args: tuple,
+    kwargs: dict
+) -> Dict[str, Any]:
     """
-        Applying arguments to a function signature.
-        :raises TypeError: error of 'bind_partial' method.
+        Partial binding of the arguments to the parameters that are not bound yet.
+        'free' - positional parameters that are not bound yet, in the signature order.
+        Without arguments - applies defaults, variadic parameters stay unbound.
+        :raises TypeError: arguments do not match the parameters.
     """
-    bound_args = sig.bind_partial(*args, **kwargs)
     if len(args) == 0 and len(kwargs) == 0:
-        bound_args.apply_defaults()
-        for name, par in sig.parameters.items():
-            if par.kind == inspect.Parameter.VAR_KEYWORD or par.kind == inspect.Parameter.VAR_POSITIONAL:
-                bound_args.arguments.pop(name, None)
-    return bound_args
-
+        return {**plan.defaults, **bound}  # the bound values take precedence over the defaults
+
+    new_bound = dict(bound)
+
+    new_bound.update(zip(free, args))
+    if len(args) > len(free):
+        if plan.var_pos is None or plan.var_pos in bound:
+            raise TypeError("too many positional arguments")
+        new_bound[plan.var_pos] = args[len(free):]
+    if len(kwargs) == 0:
+        return new_bound
+
+    extra = dict()
+    for name, value in kwargs.items():
+        if name in plan.keyword_names:
+            if name in new_bound:
+                raise TypeError(f"multiple values for argument '{name}'")
+            new_bound[name] = value
+        elif plan.var_kw is not None and plan.var_kw not in bound:
+            extra[name] = value
+        else:
+            raise TypeError(f"got an unexpected keyword argument '{name}'")
+    if len(extra) > 0:
+        new_bound[plan.var_kw] = extra
+    return new_bound
+
+
+def _call(fn, plan: _ParamPlan, bound: Dict[str, Any]):
+    """Calling the function with all parameters bound"""
+    args = [bound[name] for name in plan.positional_names]
+    if plan.var_pos is not None:
+        args.extend(bound[plan.var_pos])
+    kwargs = {name: bound[name] for name in plan.kw_only_names}
+    if plan.var_kw is not None:
+        kwargs.update(bound[plan.var_kw])
+    return fn(*args, **kwargs)
+
+
+class _CurryStep:
+    """
+        A step of currying with the arguments bound so far.
+        It looks like the original function, as after 'functools.wraps', but the attributes are placed
+        into the '__dict__' at once - much cheaper than a new closure with each attribute set separately.
+    """
 
-def _curry_step(fn, signature, positioned_args, named_args) -> Callable[..., Union[Callable, R]]:
-    def _curry_step_inner(*args, **kwargs) -> Union[Callable, R]:
+    __slots__ = ["_fn", "_plan", "_metadata", "_bound", "_free", "_idle", "__dict__", "__weakref__"]
+
+    def __call__(self, *args, **kwargs) -> Union[Callable, R]:
+        fn, plan, bound, free = self._fn, self._plan, self._bound, self._free
+        if len(kwargs) == 0 and 0 < len(args) <= len(free):  # positional arguments only - nothing to validate
+            new_bound = dict(bound)
+            new_bound.update(zip(free, args))
+            if len(new_bound) == len(plan.names):
+                return _call(fn, plan, new_bound)
+            return _curry_step(fn, plan, self._metadata, new_bound, free[len(args):])
+        if self._idle and len(args) == 0 and len(kwargs) == 0:
+            return self
         try:
-            bound_args = _apply(signature, *args, **kwargs)
-            new_params = [par for name, par in signature.parameters.items() if name not in bound_args.arguments]
-            if len(new_params) == 0:
-                return fn(*positioned_args, *bound_args.args, **named_args, **bound_args.kwargs)
-
-            new_sig = inspect.Signature(parameters=new_params)
-            new_pos = [*positioned_args, *bound_args.args]
-            new_named = {**named_args, **bound_args.kwargs}
-            return _curry_step(fn, new_sig, new_pos, new_named)
+            new_bound = _apply(plan, bound, free, args, kwargs)
         except TypeError as err:
-            raise CurryBadArguments(func_name=_extract_name(fn), err=err.args[0]) from None
-
-    return wraps(fn)(_curry_step_inner)
+            raise CurryBadArguments(func_name=panics.extract_name(fn), err=err.args[0]) from None
+        if len(new_bound) == len(plan.names):
+            return _call(fn, plan, new_bound)
+        if len(kwargs) == 0 and len(args) > 0:  # only positional arguments - they take the free names in order
+            return _curry_step(fn, plan, self._metadata, new_bound, free[len(args):])
+        free = tuple(name for name in free if name not in new_bound)
+        return _curry_step(fn, plan, self._metadata, new_bound, free)
+
+    def __get__(self, instance, owner=None):
+        """As a function - a step stored in a class is bound to its instances"""
+        return self if instance is None else MethodType(self, instance)
+
+    def __repr__(self):
+        return f"<curried {panics.extract_name(self._fn)}>"
+
+
+def _curry_step(
+    fn,
+    plan: _ParamPlan,
+    metadata: Dict[str, Any],
+    bound: Dict[str, Any],
+    free: Tuple[str, ...]
+) -> _CurryStep:
+    step = _CurryStep.__new__(_CurryStep)
+    step._fn = fn
+    step._plan = plan
+    step._metadata = metadata
+    step._bound = bound
+    step._free = free
+    # without arguments and without defaults to apply - nothing changes, the step is returned as is
+    step._idle = len(bound) < len(plan.names) and plan.defaults.keys() <= bound.keys()
+    attributes = step.__dict__  # the same order as in 'functools.wraps'
+    attributes.update(metadata)
+    attributes.update(getattr(fn, "__dict__", {}))
+    attributes['__wrapped__'] = fn
+    return step
 
 
 def curry(fn: Callable[..., R]) -> Callable[..., Union[Callable, R]]:
@@ -129,9 +276,7 @@ def curry(fn: Callable[..., R]) -> Callable[..., Union[Callable, R]]:
         :raises CurryBadFunctionError: passed function is not suitable
         :raises CurryBadArguments: error at the level of the arguments being passed
     """
-    _panic_on_bad_curried(func=fn)
-
-    def curried(*args, **kwargs) -> Union[Callable, R]:
-        return _curry_step(fn, inspect.signature(fn), list(), dict())(*args, **kwargs)
-
-    return wraps(fn)(curried)
+    panics.on_bad_curried(func=fn)
+    plan = _plan(fn)
+    # steps never change their bound arguments - the first one is built once and shared by all calls
+    return _curry_step(fn, plan, _metadata(fn), dict(), plan.positional_names)
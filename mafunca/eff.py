@@ -1,11 +1,13 @@
-from typing import TypeVar, TypeAlias, Generic, Union, Optional, Never
+from typing import TypeVar, TypeAlias, Generic, Union, Optional, Tuple, Never
 from collections.abc import Callable, Awaitable
-import inspect
+from functools import partial
 import asyncio
 
-from mafunca.triple import Left, Nothing, TUtils
+from mafunca.triple import Left, Nothing, is_bad
 from mafunca.common.exceptions import MonadError
 import mafunca.common._panics as panics # noqa
+import mafunca.common._shared as shared # noqa
+import mafunca.common._eff_specs as specs # noqa
 
 
 __all__ = ['Eff', 'DefaultBad']
@@ -28,7 +30,59 @@ _T = TypeVar('_T')
 
 
 async def _maybe_await(obj: Union[Awaitable[_T], _T]) -> _T:
-    return await obj if inspect.isawaitable(obj) else obj
+    return await obj if panics.isawaitable(obj) else obj
+
+
+def _is_coroutine_function(fn: Callable) -> bool:
+    """Known at build time - a coroutine function always returns an awaitable"""
+    return bool(panics.flags(fn) & panics.IS_COROUTINE)
+
+
+_FUSED_MAPS = "__mafunca_eff_maps__"
+
+
+def _unlink(node: Optional[tuple]) -> Tuple[Tuple[Callable, bool], ...]:
+    """The fused functions in the order of the 'map' calls - from the last node of their linked chain"""
+    steps = []
+    while node is not None:
+        node, fn, check_contract = node
+        steps.append((fn, check_contract))
+    steps.reverse()
+    return tuple(steps)
+
+
+def _fused_maps(effect: Callable, maybe_bad: bool, node: tuple, monad: type) -> Callable[[], Awaitable]:
+    """
+        A single step for adjacent 'map' calls - one await frame instead of one per function.
+        The short circuit and the contract are checked after each function, as for separate steps.
+        'node' - the last fused function: the previous node (None for the first), the function and the need
+        to check its result. A new 'map' only links a node, the chain is flattened once - at the first run.
+    """
+    effect_is_coro = _is_coroutine_function(effect)
+    steps = None
+
+    async def fused_maps():
+        nonlocal steps
+        if steps is None:
+            steps = _unlink(node)
+        previous = effect()
+        if effect_is_coro or panics.isawaitable(previous):
+            previous = await previous
+        check_bad = maybe_bad
+        for fn, check_contract in steps:
+            if check_bad and is_bad(previous):
+                return previous
+            check_bad = True
+            current = fn(previous)
+            if panics.isawaitable(current):
+                current = await current
+            if check_contract and isinstance(current, monad):
+                panics.on_monadic_result(current, fn=fn, monad=monad, method='map')
+            previous = current
+        return previous
+
+    setattr(fused_maps, _FUSED_MAPS, (effect, maybe_bad, node))
+    return fused_maps
 
 
 _Effect: TypeAlias = Callable[[], Union[_Ok, _Bad, Awaitable[_Ok], Awaitable[_Bad]]]
@@ -41,10 +95,11 @@ class Eff(Generic[_Ok, _Bad]):
        Can work with both synchronous and asynchronous functions.
     """
 
-    __slots__ = ["_effect"]
+    __slots__ = ["_effect", "_maybe_bad"]
 
     def __init__(self, effect: _Effect):
         self._effect = effect
+        self._maybe_bad = True  # the effect can produce a bad Triple entity
 
     @property
     def effect(self) -> _Effect:
@@ -59,15 +114,22 @@ class Eff(Generic[_Ok, _Bad]):
            It can accept both async and sync functions. Async functions are awaited.
            :raises MonadError: violation of the contract
         """
-
-        async def new_effect():
-            previous = await _maybe_await(self.effect())
-            if TUtils.is_bad(previous):
-                return previous
-            current = await _maybe_await(fn(previous))
-            panics.on_monadic_result(current, fn=fn, monad=self.__class__, method='map')
-            return current
-        return Eff(new_effect)
+        effect, cls = self.effect, type(self)
+        check_contract = not panics.is_unrelated_result(fn, cls)
+        fused = getattr(effect, _FUSED_MAPS, None)
+        if fused is not None:  # the previous step is a map - the functions are fused into one step
+            source, maybe_bad, node = fused
+            return Eff(_fused_maps(source, maybe_bad, (node, fn, check_contract), cls))
+        make = specs.step_factory(
+            'map',
+            effect_is_coro=_is_coroutine_function(effect),
+            fn_is_coro=_is_coroutine_function(fn),
+            maybe_bad=self._maybe_bad,
+            check_contract=check_contract
+        )
+        step = make(effect, fn, cls, 'map', is_bad)
+        setattr(step, _FUSED_MAPS, (effect, self._maybe_bad, (None, fn, check_contract)))
+        return Eff(step)
 
     def map_to_thread(self, fn: Callable[[_Ok], Union[_Result, _NewBad]]) -> 'Eff[_Result, Union[_Bad, _NewBad]]':
         """
@@ -75,14 +137,21 @@ class Eff(Generic[_Ok, _Bad]):
            Executes it in a separate thread.
            :raises MonadError: violation of the contract
         """
-        panics.on_coroutine(fn, monad_name=self.__class__.__name__, method='map_to_thread')
+        effect, cls = self.effect, type(self)
+        panics.on_coroutine(fn, monad_name=cls.__name__, method='map_to_thread')
+        maybe_bad = self._maybe_bad
+        effect_is_coro = _is_coroutine_function(effect)
+        check_contract = not panics.is_unrelated_result(fn, cls)
 
         async def new_effect():
-            previous = await _maybe_await(self.effect())
-            if TUtils.is_bad(previous):
+            previous = effect()
+            if effect_is_coro or panics.isawaitable(previous):
+                previous = await previous
+            if maybe_bad and is_bad(previous):
                 return previous
             current = await asyncio.to_thread(fn, previous)
-            panics.on_monadic_result(current, fn=fn, monad=self.__class__, method='map_to_thread')
+            if check_contract and isinstance(current, cls):
+                panics.on_monadic_result(current, fn=fn, monad=cls, method='map_to_thread')
             return current
 
         return Eff(new_effect)
@@ -93,16 +162,15 @@ class Eff(Generic[_Ok, _Bad]):
            It can accept both async and sync functions. Async functions are awaited.
            :raises MonadError: violation of the contract
         """
-
-        async def new_effect():
-            previous = await _maybe_await(self.effect())
-            if TUtils.is_bad(previous):
-                return previous
-            current_effect = await _maybe_await(fn(previous))
-            panics.on_another_instance(current_effect, fn=fn, monad=self.__class__, method='bind')
-            current = await _maybe_await(current_effect.effect())
-            return current
-        return Eff(new_effect)
+        effect, cls = self.effect, type(self)
+        make = specs.step_factory(
+            'bind',
+            effect_is_coro=_is_coroutine_function(effect),
+            fn_is_coro=_is_coroutine_function(fn),
+            maybe_bad=self._maybe_bad,
+            check_contract=True
+        )
+        return Eff(make(effect, fn, cls, 'bind', is_bad))
 
     def bind_to_thread(self, fn: Callable[[_Ok], 'Eff[_Result, _NewBad]']) -> 'Eff[_Result, Union[_Bad, _NewBad]]':
         """
@@ -110,14 +178,24 @@ class Eff(Generic[_Ok, _Bad]):
            Executes it in a separate thread - ONLY inner function inside Eff.
            :raises MonadError: violation of the contract
         """
+        effect, cls = self.effect, type(self)
+        maybe_bad = self._maybe_bad
+        monad_name = cls.__name__
+        effect_is_coro = _is_coroutine_function(effect)
+        fn_is_coro = _is_coroutine_function(fn)
 
         async def new_effect():
-            previous = await _maybe_await(self.effect())
-            if TUtils.is_bad(previous):
+            previous = effect()
+            if effect_is_coro or panics.isawaitable(previous):
+                previous = await previous
+            if maybe_bad and is_bad(previous):
                 return previous
-            current_effect = await _maybe_await(fn(previous))
-            panics.on_another_instance(current_effect, fn=fn, monad=self.__class__, method='bind_to_thread')
-            panics.on_coroutine(current_effect.effect, monad_name=self.__class__.__name__, method='bind_to_thread')
+            current_effect = fn(previous)
+            if fn_is_coro or panics.isawaitable(current_effect):
+                current_effect = await current_effect
+            if current_effect.__class__ is not cls:
+                panics.on_another_instance(current_effect, fn=fn, monad=cls, method='bind_to_thread')
+            panics.on_coroutine(current_effect.effect, monad_name=monad_name, method='bind_to_thread')
             current = await asyncio.to_thread(current_effect.effect)
             return current
 
@@ -133,15 +211,20 @@ class Eff(Generic[_Ok, _Bad]):
            It can accept both async and sync functions. Async functions are awaited.
            MonadError is not suppressed.
         """
+        effect, cls = self.effect, type(self)
+        effect_is_coro = _is_coroutine_function(effect)
 
         async def new_effect():
             try:
-                return await _maybe_await(self.effect())
+                previous = effect()
+                if effect_is_coro or panics.isawaitable(previous):
+                    previous = await previous
+                return previous
             except Exception as err:
-                if isinstance(err, MonadError):
+                if err.__class__ is MonadError or isinstance(err, MonadError):
                     raise err
                 current = await _maybe_await(fn(err))
-                if isinstance(current, self.__class__):
+                if isinstance(current, cls):
                     return await _maybe_await(current.effect())
                 return current
         return Eff(new_effect)
@@ -150,19 +233,27 @@ class Eff(Generic[_Ok, _Bad]):
         """Guaranteed to execute the function-parameter, similar to try finally.
            It can accept both async and sync functions. Async functions are awaited.
         """
+        effect = self.effect
+        effect_is_coro = _is_coroutine_function(effect)
+        fn_is_coro = _is_coroutine_function(fn)
 
         async def new_effect():
             try:
-                return await _maybe_await(self.effect())
+                previous = effect()
+                if effect_is_coro or panics.isawaitable(previous):
+                    previous = await previous
+                return previous
             finally:
-                await _maybe_await(fn())
+                finished = fn()
+                if fn_is_coro or panics.isawaitable(finished):
+                    await finished
         return Eff(new_effect)
 
     def to_task(self) -> asyncio.Task:
         """Wraps the inner effect into a Task. Inner effect must be a coroutine function.
            :raises MonadError: inner effect is a sync function
         """
-        panics.on_sync(self.effect, monad_name=self.__class__.__name__, method='to_task')
+        panics.on_sync(self.effect, monad_name=type(self).__name__, method='to_task')
         return asyncio.create_task(self.effect())
 
     async def run(self, delay: Optional[Union[int, float]] = None) -> Union[_Ok, _Bad]:
@@ -171,20 +262,24 @@ class Eff(Generic[_Ok, _Bad]):
            :raises TimeoutError: delay is not None and the waiting time has been exceeded.
         """
         if delay is None:
-            return await _maybe_await(self.effect())
+            result = self.effect()
+            return await result if panics.isawaitable(result) else result
         else:
             async with asyncio.timeout(delay=delay):
-                return await _maybe_await(self.effect())
+                result = self.effect()
+                return await result if panics.isawaitable(result) else result
 
     @staticmethod
     def of(value: _Result) -> 'Eff[_Result, Never]':
         """Wraps a non-Eff 'GOOD' value in the container. No inspections here."""
-        return Eff(lambda: value)
+        eff = Eff(partial(shared.const, value))
+        eff._maybe_bad = is_bad(value)  # the value is known in advance - checked once
+        return eff
 
     @staticmethod
     def from_result(value: Union[_Result, _NewBad]) -> 'Eff[_Result, _NewBad]':
         """Wraps a non-Eff value in the container. No inspections here."""
-        return Eff(lambda: value)
+        return Eff(partial(shared.const, value))
 
     def __repr__(self):
         return f"Eff({self.effect})"
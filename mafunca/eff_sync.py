@@ -1,9 +1,12 @@
-from typing import TypeVar, Generic, Union, Never
-from collections.abc import Callable
+from typing import TypeVar, Generic, Union, Optional, List, Tuple, Any, Never
+from collections.abc import Callable, Iterable, Sequence
+from functools import partial
+import sys
 
-from mafunca.triple import Left, Nothing, TUtils
+from mafunca.triple import Left, Nothing, is_bad
 from mafunca.common.exceptions import MonadError
 import mafunca.common._panics as panics # noqa
+import mafunca.common._shared as shared # noqa
 
 
 __all__ = ['EffSync', 'DefaultBad']
@@ -18,53 +21,200 @@ _Bad = TypeVar('_Bad', bound=DefaultBad)
 _NewBad = TypeVar('_NewBad', bound=DefaultBad)
 
 
+# tags of the chain steps
+_MAP = 0
+_BIND = 1
+_CATCH = 2
+_ENSURE = 3
+_TRANSFORM = 4
+_REDEEM = 5
+
+_TAG_NAMES = ('map', 'bind', 'catch', 'ensure', 'transform_with', 'redeem')
+
+# (tag, function, maybe_bad, extra)
+# 'extra' - the need of the contract check for 'map', 'on_err' for 'transform_with' and 'redeem',
+# all the functions of the adjacent calls folded into one step for 'ensure'
+_Step = Tuple[int, Callable, bool, Any]
+
+
+def _call_handling(err: Optional[BaseException], fn: Callable, *args):
+    """
+        Calls the function as if inside the 'except' block of the error - errors raised by it are chained to that one.
+        The error is raised again only if it is not the one being handled already, its traceback stays as it was.
+    """
+    if err is None or sys.exception() is err:
+        return fn(*args)
+    traceback = err.__traceback__
+    try:
+        raise err
+    except BaseException:
+        err.__traceback__ = traceback
+        return fn(*args)
+
+
+def _finalize(fns: Tuple[Callable[[], None], ...], err: Optional[BaseException]) -> Optional[BaseException]:
+    """Executes all the functions of the folded 'ensure' calls - an error of each replaces the previous one"""
+    for fn in fns:
+        try:
+            _call_handling(err, fn)
+        except BaseException as new_err:
+            err = new_err
+    return err
+
+
+def _intercept(tag: int, handler: Callable, err: Exception, monad: type) -> Any:
+    """The result of the handler of the intercepted error - an effect returned by it is executed"""
+    current = handler(err)
+    if isinstance(current, monad):
+        if tag is _REDEEM:
+            panics.on_monadic_result(current, fn=handler, monad=monad, method='redeem')
+        current = current.effect()
+    return current
+
+
+def _recover(err: BaseException, steps: Sequence[_Step], index: int, monad: type) -> Tuple[Any, int]:
+    """
+        Search forward for the nearest step that intercepts the error, executing 'ensure' steps on the way.
+        Returns the recovered value and the index of the step to continue from.
+        MonadError and non-Exception errors are not intercepted.
+        :raises BaseException: the error has not been intercepted
+    """
+    count = len(steps)
+    while index < count:
+        tag, fn, _, extra = steps[index]
+        index += 1
+        if tag is _ENSURE:
+            err = _finalize(extra, err)
+        elif tag is _CATCH or tag is _TRANSFORM or tag is _REDEEM:
+            if not isinstance(err, Exception) or err.__class__ is MonadError or isinstance(err, MonadError):
+                continue
+            handler = fn if tag is _CATCH else extra
+            try:
+                return _call_handling(err, _intercept, tag, handler, err, monad), index
+            except BaseException as new_err:
+                err = new_err
+    raise err
+
+
+def _execute(prime: Callable, steps: Sequence[_Step], monad: type):
+    """
+        Iterative execution of the chain - the depth of the Python stack does not depend on its length.
+        :raises MonadError: violation of the contract
+    """
+    index, count = 0, len(steps)
+    failure = None
+    try:
+        value = prime()
+    except BaseException as err:
+        failure = err
+    if failure is not None:
+        # recovery runs outside the 'except' block - raising there would replace the context of the final error
+        value, index = _recover(failure, steps, index, monad)
+    while index < count:
+        tag, fn, maybe_bad, extra = steps[index]
+        index += 1
+        try:
+            if tag is _MAP:
+                if maybe_bad and is_bad(value):
+                    continue
+                current = fn(value)
+                if extra and isinstance(current, monad):
+                    panics.on_monadic_result(current, fn=fn, monad=monad, method='map')
+                value = current
+            elif tag is _BIND:
+                if maybe_bad and is_bad(value):
+                    continue
+                current_effect = fn(value)
+                if current_effect.__class__ is not monad:
+                    panics.on_another_instance(current_effect, fn=fn, monad=monad, method='bind')
+                value = current_effect.effect()
+            elif tag is _ENSURE:
+                err = _finalize(extra, None)
+                if err is not None:
+                    raise err
+            elif tag is _TRANSFORM:
+                if maybe_bad and is_bad(value):
+                    continue
+                current_effect = fn(value)
+                if current_effect.__class__ is not monad:
+                    panics.on_another_instance(current_effect, fn=fn, monad=monad, method='transform_with')
+                value = current_effect.effect()
+            elif tag is _REDEEM:
+                if maybe_bad and is_bad(value):
+                    continue
+                current = fn(value)
+                if isinstance(current, monad):
+                    panics.on_monadic_result(current, fn=fn, monad=monad, method='redeem')
+                value = current
+            # '_CATCH' - without an error the value passes as is
+            continue
+        except BaseException as err:
+            failure = err
+        value, index = _recover(failure, steps, index, monad)
+    return value
+
+
+def _sequence(chains: Tuple[Tuple[Callable, Sequence[_Step]], ...], monad: type) -> Union[List[Any], DefaultBad]:
+    """
+        Runs the chains unwound in advance one after another and collects their results.
+        A bad Triple entity short-circuits the rest of the chains.
+    """
+    results = []
+    for prime, steps in chains:
+        value = _execute(prime, steps, monad) if steps else prime()
+        if is_bad(value):
+            return value
+        results.append(value)
+    return results
+
+
 class EffSync(Generic[_Ok, _Bad]):
     """Lazy monad for sync effects.
        It can work with bad 'Triple' entities using the short-circuit principle
     """
 
-    __slots__ = ["_effect"]
+    __slots__ = ["_effect", "_maybe_bad", "_past", "_step", "_unwound"]
 
     def __init__(self, effect: Callable[[], Union[_Ok, _Bad]]):
-        panics.on_coroutine(effect, monad_name=self.__class__.__name__, method='__init__')
+        panics.on_coroutine(effect, monad_name=type(self).__name__, method='__init__')
         self._effect = effect
+        self._maybe_bad = True  # the effect can produce a bad Triple entity
+        self._past: Optional['EffSync'] = None
+        self._step: Optional[_Step] = None
+        self._unwound: Optional[Tuple[Callable, Tuple[_Step, ...]]] = None
+
+    def _chain(self, step: _Step) -> 'EffSync':
+        """For inner usage only. A new link of the chain - the function is applied by the 'run' loop"""
+        eff = EffSync.__new__(EffSync)
+        eff._effect = None
+        eff._maybe_bad = True
+        eff._past = self
+        eff._step = step
+        eff._unwound = None
+        return eff
 
     @property
     def effect(self) -> Callable[[], Union[_Ok, _Bad]]:
-        return self._effect
+        if self._step is None:
+            return self._effect
+        return self.run
 
     def map(self, fn: Callable[[_Ok], Union[_Result, _NewBad]]) -> 'EffSync[_Result, Union[_Bad, _NewBad]]':
         """
            Applies a sync function that returns a non-EffSync entity.
            :raises MonadError: violation of the contract
         """
-        panics.on_coroutine(fn, monad_name=self.__class__.__name__, method='map')
-
-        def new_effect():
-            previous = self.effect()
-            if TUtils.is_bad(previous):
-                return previous
-            current = fn(previous)
-            panics.on_monadic_result(current, fn=fn, monad=self.__class__, method='map')
-            return current
-        return EffSync(new_effect)
+        cls = type(self)
+        panics.on_coroutine(fn, monad_name=cls.__name__, method='map')
+        return self._chain((_MAP, fn, self._maybe_bad, not panics.is_unrelated_result(fn, cls)))
 
     def bind(self, fn: Callable[[_Ok], 'EffSync[_Result, _NewBad]']) -> 'EffSync[_Result, Union[_Bad, _NewBad]]':
         """
            Applies a sync function that returns an EffSync entity.
            :raises MonadError: violation of the contract
         """
-        panics.on_coroutine(fn, monad_name=self.__class__.__name__, method='bind')
-
-        def new_effect():
-            previous = self.effect()
-            if TUtils.is_bad(previous):
-                return previous
-            current_effect = fn(previous)
-            panics.on_another_instance(current_effect, fn=fn, monad=self.__class__, method='bind')
-            current = current_effect.effect()
-            return current
-        return EffSync(new_effect)
+        panics.on_coroutine(fn, monad_name=type(self).__name__, method='bind')
+        return self._chain((_BIND, fn, self._maybe_bad, None))
 
     def catch(
         self,
@@ -75,44 +225,107 @@ class EffSync(Generic[_Ok, _Bad]):
            It can return both EffSync and non-EffSync entities.
            MonadError is not suppressed.
         """
-        panics.on_coroutine(fn, monad_name=self.__class__.__name__, method='catch')
+        panics.on_coroutine(fn, monad_name=type(self).__name__, method='catch')
+        return self._chain((_CATCH, fn, False, None))
 
-        def new_effect():
-            try:
-                return self.effect()
-            except Exception as err:
-                if isinstance(err, MonadError):
-                    raise err
-                current = fn(err)
-                if isinstance(current, self.__class__):
-                    return current.effect()
-                return current
-        return EffSync(new_effect)
+    def transform_with(
+        self,
+        on_ok: Callable[[_Ok], 'EffSync[_Result, _NewBad]'],
+        on_err: Callable[[_Exception], Union['EffSync[_Result, _NewBad]', _Result, _NewBad]]
+    ) -> 'EffSync[_Result, Union[_Bad, _NewBad]]':
+        """
+           Combines 'catch' and 'bind' in one step: 'on_err' intercepts errors of the previous effects,
+           'on_ok' is applied to their result as in 'bind'. Unlike '.catch(on_err).bind(on_ok)',
+           a recovered value is not passed to 'on_ok', and errors of 'on_ok' are not intercepted.
+           MonadError is not suppressed.
+           :raises MonadError: violation of the contract
+        """
+        monad_name = type(self).__name__
+        panics.on_coroutine(on_ok, monad_name=monad_name, method='transform_with')
+        panics.on_coroutine(on_err, monad_name=monad_name, method='transform_with')
+        return self._chain((_TRANSFORM, on_ok, self._maybe_bad, on_err))
+
+    def redeem(
+        self,
+        on_err: Callable[[_Exception], Union[_Result, _NewBad]],
+        on_ok: Callable[[_Ok], Union[_Result, _NewBad]]
+    ) -> 'EffSync[_Result, Union[_Bad, _NewBad]]':
+        """
+           Combines 'catch' and 'map' in one step: 'on_err' intercepts errors of the previous effects,
+           'on_ok' is applied to their result as in 'map'. Both return non-EffSync values.
+           A recovered value is not passed to 'on_ok', and errors of 'on_ok' are not intercepted.
+           MonadError is not suppressed.
+           :raises MonadError: violation of the contract
+        """
+        monad_name = type(self).__name__
+        panics.on_coroutine(on_err, monad_name=monad_name, method='redeem')
+        panics.on_coroutine(on_ok, monad_name=monad_name, method='redeem')
+        return self._chain((_REDEEM, on_ok, self._maybe_bad, on_err))
 
     def ensure(self, fn: Callable[[], None]) -> 'EffSync[_Ok, _Bad]':
         """Guaranteed to execute the function-parameter, similar to try finally"""
-        panics.on_coroutine(fn, monad_name=self.__class__.__name__, method='ensure')
+        panics.on_coroutine(fn, monad_name=type(self).__name__, method='ensure')
+        step = self._step
+        if step is not None and step[0] is _ENSURE:  # adjacent calls are folded into one step of the chain
+            return self._past._chain((_ENSURE, fn, False, step[3] + (fn,)))
+        return self._chain((_ENSURE, fn, False, (fn,)))
 
-        def new_effect():
-            try:
-                return self.effect()
-            finally:
-                fn()
-        return EffSync(new_effect)
+    def _unwind(self) -> Tuple[Callable, Tuple[_Step, ...]]:
+        """For inner usage only. Unwinding the chain to the first effect - once, the next runs reuse the result."""
+        unwound = self._unwound
+        if unwound is None:
+            steps = []
+            current = self
+            while current._step is not None:
+                steps.append(current._step)
+                current = current._past
+            steps.reverse()
+            unwound = self._unwound = (current._effect, tuple(steps))
+        return unwound
+
+    def compile(self) -> Callable[[], Union[_Ok, _Bad]]:
+        """Flat function of the whole chain - the same as 'run', without going through the EffSync entity"""
+        if self._step is None:
+            return self._effect
+        prime, steps = self._unwind()
+        return partial(_execute, prime, steps, type(self))
 
     def run(self) -> Union[_Ok, _Bad]:
         """Starts the chain"""
-        return self.effect()
+        if self._step is None:
+            return self._effect()
+        prime, steps = self._unwind()
+        return _execute(prime, steps, type(self))
 
     @staticmethod
     def of(value: _Result) -> 'EffSync[_Result, Never]':
         """Wraps a non-EffSync 'GOOD' value in the container. No inspections here."""
-        return EffSync(lambda: value)
+        eff = EffSync(partial(shared.const, value))
+        eff._maybe_bad = is_bad(value)  # the value is known in advance - checked once
+        return eff
 
     @staticmethod
     def from_result(value: Union[_Result, _NewBad]) -> 'EffSync[_Result, _NewBad]':
         """Wraps a non-Eff value in the container. No inspections here."""
-        return EffSync(lambda: value)
+        return EffSync(partial(shared.const, value))
+
+    @staticmethod
+    def sequence(effs: Iterable['EffSync[_Result, _NewBad]']) -> 'EffSync[List[_Result], _NewBad]':
+        """
+           Combines the effects into one that runs them in order and returns the list of their results.
+           A bad Triple entity of any effect is returned instead of the list, the rest are not run.
+           The chains are unwound once here, not on every run.
+           :raises MonadError: not an EffSync entity is passed
+        """
+        chains = []
+        for eff in effs:
+            if not isinstance(eff, EffSync):
+                raise MonadError('EffSync', 'sequence', f"{eff} must be 'EffSync' entity")
+            chains.append(eff._unwind())
+        return EffSync(partial(_sequence, tuple(chains), EffSync))
 
     def __repr__(self):
-        return f"EffSync({self.effect})"
+        if self._step is None:
+            return f"EffSync({self._effect})"
+        tag, fn, _, _ = self._step
+        return f"EffSync({_TAG_NAMES[tag]}: {fn})"
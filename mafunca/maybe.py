@@ -81,13 +81,15 @@ class Nothing:
 
 Maybe: TypeAlias = Union[Just[T], Nothing]
 
+_NOTHING = Nothing()  # Nothing carries no value - one shared instance for the library functions
+
 
 def just_of(value: T) -> Just[T]:
     return Just(value)
 
 
 def nothing_of() -> Nothing:
-    return Nothing()
+    return _NOTHING
 
 
 Args = ParamSpec('Args')
@@ -100,7 +102,7 @@ A4 = TypeVar("A4")
 def from_null(is_nullable: Callable[[R], bool] = lambda v: v is None) -> Callable[[R], Maybe[R]]:
     """Closure. Wraps a value in the Nothing if 'is_nullable' returns true, otherwise - Just"""
     def from_null_inner(value: R) -> Maybe[R]:
-        return Nothing() if is_nullable(value) else Just(value)
+        return _NOTHING if is_nullable(value) else Just(value)
 
     return from_null_inner
 
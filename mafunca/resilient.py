@@ -2,7 +2,7 @@ from typing import TypeVar, TypeAlias, Generic, Union, Optional, List, Tuple, An
 from collections.abc import Callable, Awaitable
 import asyncio
 
-from mafunca.triple import TUtils, Left, Nothing
+from mafunca.triple import Left, Nothing, is_bad
 from mafunca.common.resilient_support import Uncaught, Report
 from mafunca.common.exceptions import MonadError
 import mafunca.common._resilient_specs as specs # noqa
@@ -79,7 +79,7 @@ class Resilient(Generic[_Ok, _Bad]):
         fn: Callable[[_Ok], Union[_AwaitableSelf, _AwaitableResult, _AwaitableNewBad]]
     ) -> 'Resilient[_Result, Union[_Bad, _NewBad]]':
         """Combines the logic of both 'map' and 'bind' in regular monads"""
-        return self.__class__(specs.continuer(fn, bad_evaluator=TUtils.is_bad), past=self)
+        return self.__class__(specs.continuer(fn, bad_evaluator=is_bad), past=self)
 
     def catch(
         self,
@@ -113,7 +113,7 @@ class Resilient(Generic[_Ok, _Bad]):
         cls = self.__class__
         first_effect, cons = self._unwind()
         result = await _execute_prime(first_effect)
-        if rebuild and (isinstance(result, Uncaught) or TUtils.is_bad(result)):
+        if rebuild and (isinstance(result, Uncaught) or is_bad(result)):
             return Report(result, chain_from_failure=self, faulty=first_effect, last_success=None)
 
         restored, faulty, last_success = None, None, result if rebuild else None
@@ -130,7 +130,7 @@ class Resilient(Generic[_Ok, _Bad]):
                 if restored_new:
                     # if we're in this branch, it's the first failure!
                     restored, faulty, last_success = restored_new, faulty_new, last_success_new
-                elif isinstance(result_new, Uncaught) or TUtils.is_bad(result_new):
+                elif isinstance(result_new, Uncaught) or is_bad(result_new):
                     if restored is None:
                         prime = cls(_make_effect(result))
                         restored, faulty = cls(cons[i], past=prime), specs.get_origin(cons[i])
@@ -2,7 +2,7 @@ from typing import TypeVar, TypeAlias, Generic, Union, Optional, List, Tuple, An
 from collections.abc import Callable
 from time import sleep
 
-from mafunca.triple import TUtils, Left, Nothing
+from mafunca.triple import Left, Nothing, is_bad
 from mafunca.common.resilient_support import Uncaught, Report
 from mafunca.common.exceptions import MonadError
 import mafunca.common._panics as panics  # noqa
@@ -74,7 +74,7 @@ class ResilientSync(Generic[_Ok, _Bad]):
             :raises MonadError: panics on coroutine function
         """
         panics.on_coroutine(fn, monad_name=self.__class__.__name__, method='chain')
-        return self.__class__(specs.continuer_sync(fn, bad_evaluator=TUtils.is_bad), past=self)
+        return self.__class__(specs.continuer_sync(fn, bad_evaluator=is_bad), past=self)
 
     def catch(
         self,
@@ -122,7 +122,7 @@ class ResilientSync(Generic[_Ok, _Bad]):
         cls = self.__class__
         first_effect, cons = self._unwind()
         result = _execute_prime(first_effect)
-        if rebuild and (isinstance(result, Uncaught) or TUtils.is_bad(result)):
+        if rebuild and (isinstance(result, Uncaught) or is_bad(result)):
             return Report(result, chain_from_failure=self, faulty=first_effect, last_success=None)
 
         restored, faulty, last_success = None, None, result if rebuild else None
@@ -139,7 +139,7 @@ class ResilientSync(Generic[_Ok, _Bad]):
                 if restored_new:
                     # if we're in this branch, it's the first failure!
                     restored, faulty, last_success = restored_new, faulty_new, last_success_new
-                elif isinstance(result_new, Uncaught) or TUtils.is_bad(result_new):
+                elif isinstance(result_new, Uncaught) or is_bad(result_new):
                     if restored is None:
                         prime = cls(_make_effect(result))
                         restored, faulty = cls(cons[i], past=prime), specs.get_origin(cons[i])
@@ -1,10 +1,12 @@
 from abc import ABC, abstractmethod
-from typing import TypeVar, ParamSpec, Generic, Union, Optional, Never
+from typing import TypeVar, ParamSpec, Generic, Union, Optional, Never, ClassVar
 from collections.abc import Callable
-from functools import wraps
+from operator import attrgetter
+from types import FunctionType
 
 from mafunca.common.exceptions import ImpureMarkError, MonadError
 import mafunca.common._panics as panics # noqa
+import mafunca.common._triple_specs as specs # noqa
 
 
 __all__ = [
@@ -15,6 +17,13 @@ __all__ = [
     'Left',
     'Nothing',
     'TUtils',
+    'of',
+    'from_nullable',
+    'from_try',
+    'lift',
+    'is_triple',
+    'is_bad',
+    'closer',
 ]
 
 
@@ -36,6 +45,8 @@ def impure(fn: Callable):
 
 def is_impure(fn: Callable) -> bool:
     """Checking that the function was marked as impure"""
+    if fn.__class__ is FunctionType:  # the mark of a plain function can only be in its own __dict__
+        return fn.__dict__.get(_IMPURE_PROP, False)
     return getattr(fn, _IMPURE_PROP, False)
 
 
@@ -49,22 +60,35 @@ _T2 = TypeVar("_T2")
 _T3 = TypeVar("_T3")
 
 
+def _identity(value):
+    """Default 'right' and 'left' of unfold - trivially valid, no checks needed"""
+    return value
+
+
+def _none() -> None:
+    """Default 'nothing' of unfold - trivially valid, no checks needed"""
+    return None
+
+
 class Triple(ABC, Generic[_Ok, _Bad]):
     """Abstract class for simple monad over the value that is available here and now"""
+
+    __slots__ = ()  # without it the slots of the branches do not remove the instance '__dict__'
+
     @property
     @abstractmethod
     def value(self) -> Optional[Union[_Ok, _Bad]]:
         pass
 
-    @property
-    @abstractmethod
-    def is_right(self) -> bool:
-        pass
+    # plain class attributes of the branches, without a property call on each check
+    is_right: ClassVar[bool]
+    is_nothing: ClassVar[bool]
+    # the name for the panic messages, set for every heir - without reading the class name on each call
+    _MONAD_NAME: ClassVar[str]
 
-    @property
-    @abstractmethod
-    def is_nothing(self) -> bool:
-        pass
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._MONAD_NAME = cls.__name__
 
     @abstractmethod
     def map(self, fn: Callable[[_Ok], _NewOk]) -> 'Triple[_NewOk, _Bad]':
@@ -95,9 +119,9 @@ class Triple(ABC, Generic[_Ok, _Bad]):
     def unfold(
         self,
         *,
-        right: Callable[[_Ok], _T1] = lambda v: v,
-        left: Callable[[_Bad], _T2] = lambda w: w,
-        nothing: Callable[[], _T3] = lambda: None
+        right: Callable[[_Ok], _T1] = _identity,
+        left: Callable[[_Bad], _T2] = _identity,
+        nothing: Callable[[], _T3] = _none
     ) -> Union[_T1, _T2, _T3]:
         pass
 
@@ -114,38 +138,61 @@ class Triple(ABC, Generic[_Ok, _Bad]):
         pass
 
 
+def _wraps(wrapper: Callable, fn: Callable) -> Callable:
+    """
+       Lightweight 'functools.wraps' - only the naming attributes, the link to the original and the impure mark.
+       The rest of the '__dict__' of the original is not copied to the wrapper.
+    """
+    for attr in ('__module__', '__name__', '__qualname__', '__doc__'):
+        try:
+            setattr(wrapper, attr, getattr(fn, attr))
+        except AttributeError:
+            pass
+    wrapper.__wrapped__ = fn
+    if is_impure(fn):
+        setattr(wrapper, _IMPURE_PROP, True)
+    return wrapper
+
+
+_GET_VALUE = attrgetter('_value')  # C-level read of the value slot of Right and Left
+
+_on_coroutine = panics.on_coroutine  # a module global instead of an attribute of the module on each check
+
+
 def _panic_on_bad_function(fn: Callable, monad: str, method: str, check_impure=True):
-    panics.on_coroutine(fn, monad_name=monad, method=method)
+    _on_coroutine(fn, monad_name=monad, method=method)
     if check_impure and is_impure(fn):
-        raise MonadError(monad, method, f"impure function '{fn.__name__}' can not be used")
+        raise MonadError(monad, method, f"impure function '{panics.extract_name(fn)}' can not be used")
+
+
+_TripleSelf = TypeVar('_TripleSelf', bound=Triple)
+
+
+def _skip(self: _TripleSelf, fn: Callable) -> _TripleSelf:
+    """The methods that do not concern the branch - one shared function, the entity is returned as is"""
+    return self
 
 
 class Right(Triple[_Ok, Never], Generic[_Ok]):
     """A branch for a value representing a successful result"""
 
-    __slots__ = ["_value"]
+    __slots__ = ["_value", "__weakref__"]
+
+    is_right = True
+    is_nothing = False
 
     def __init__(self, value: _Ok):
         self._value = value
 
-    @property
-    def value(self) -> _Ok:
-        return self._value
-
-    @property
-    def is_right(self) -> bool:
-        return True
-
-    @property
-    def is_nothing(self) -> bool:
-        return False
+    value = property(_GET_VALUE)  # read-only, without a Python frame per read
+    __match_args__ = ('value',)  # positional class patterns: 'case Right(value)'
 
     def map(self, fn: Callable[[_Ok], _NewOk]) -> 'Right[_NewOk]':
         """
            Applies a sync function that returns a non-Triple value.
            :raises MonadError: violation of the contract
         """
-        _panic_on_bad_function(fn, monad=self.__class__.__name__, method='map')
+        _panic_on_bad_function(fn, monad=self._MONAD_NAME, method='map')
         result = fn(self._value)
         return Right(result)
 
@@ -154,33 +201,25 @@ class Right(Triple[_Ok, Never], Generic[_Ok]):
             Applies a sync function that returns a Triple wrapped value.
             :raises MonadError: violation of the contract
         """
-        _panic_on_bad_function(fn, monad=self.__class__.__name__, method='bind')
+        _panic_on_bad_function(fn, monad=self._MONAD_NAME, method='bind')
         return fn(self._value)
 
-    def recover_from_left(
-        self,
-        fn: Callable[[Never], Union[Triple[_NewOk, _NewBad], _NewOk]]
-    ) -> 'Right[_Ok]':
-        return self
-
-    def recover_from_nothing(
-        self,
-        fn: Callable[[], Union[Triple[_NewOk, _NewBad], _NewOk]]
-    ) -> 'Right[_Ok]':
-        return self
+    recover_from_left = recover_from_nothing = _skip
 
     def unfold(
         self,
         *,
-        right: Callable[[_Ok], _T1] = lambda v: v,
-        left: Callable[[Never], _T2] = lambda w: w,
-        nothing: Callable[[], _T3] = lambda: None
+        right: Callable[[_Ok], _T1] = _identity,
+        left: Callable[[Never], _T2] = _identity,
+        nothing: Callable[[], _T3] = _none
     ) -> _T1:
         """
             Applies a sync function without wrapping the result. As a rule, it completes the chain.
             :raises MonadError: violation of the contract by 'right'.
         """
-        _panic_on_bad_function(right, monad=self.__class__.__name__, method='unfold')
+        if right is _identity:
+            return self._value
+        _panic_on_bad_function(right, monad=self._MONAD_NAME, method='unfold')
         return right(self._value)
 
     def ap(
@@ -192,12 +231,12 @@ class Right(Triple[_Ok, Never], Generic[_Ok]):
            Combines the logic of map and bind, wrapping simple values in a monad.
            :raises MonadError: violation of the contract.
         """
-        _panic_on_bad_function(self._value, monad=self.__class__.__name__, method='ap')
+        _panic_on_bad_function(self._value, monad=self._MONAD_NAME, method='ap')
         if not wrapped_val.is_right:
             return wrapped_val
-        val = getattr(wrapped_val, 'value')
+        val = wrapped_val._value if wrapped_val.__class__ is Right else wrapped_val.value
         result = self._value(val)
-        return result if isinstance(result, Triple) else Right(result)
+        return result if result.__class__ in _TRIPLE_TYPES or isinstance(result, Triple) else Right(result)
 
     def get_or_else(self, alter: _NewOk) -> _Ok:
         return self._value
@@ -209,28 +248,18 @@ class Right(Triple[_Ok, Never], Generic[_Ok]):
 class Left(Triple[Never, _Bad], Generic[_Bad]):
     """A branch for a value representing an error"""
 
-    __slots__ = ["_value"]
+    __slots__ = ["_value", "__weakref__"]
+
+    is_right = False
+    is_nothing = False
 
     def __init__(self, value: _Bad):
         self._value = value
 
-    @property
-    def value(self) -> _Bad:
-        return self._value
-
-    @property
-    def is_right(self) -> bool:
-        return False
+    value = property(_GET_VALUE)  # read-only, without a Python frame per read
+    __match_args__ = ('value',)  # positional class patterns: 'case Left(value)'
 
-    @property
-    def is_nothing(self) -> bool:
-        return False
-
-    def map(self, fn: Callable[[Never], _NewOk]) -> 'Left[_Bad]':
-        return self
-
-    def bind(self, fn: Callable[[Never], Triple[_NewOk, _NewBad]]) -> 'Left[_Bad]':
-        return self
+    map = bind = recover_from_nothing = _skip
 
     def recover_from_left(
         self,
@@ -241,28 +270,24 @@ class Left(Triple[Never, _Bad], Generic[_Bad]):
            Combines the logic of map and bind, wrapping simple values in a Triple.
            :raises MonadError: violation of the contract.
         """
-        _panic_on_bad_function(fn, monad=self.__class__.__name__, method='recover_from_left')
+        _panic_on_bad_function(fn, monad=self._MONAD_NAME, method='recover_from_left')
         result = fn(self._value)
-        return result if isinstance(result, Triple) else Right(result)
-
-    def recover_from_nothing(
-        self,
-        fn: Callable[[], Union[Triple[_NewOk, _NewBad], _NewOk]]
-    ) -> 'Left[_Bad]':
-        return self
+        return result if result.__class__ in _TRIPLE_TYPES or isinstance(result, Triple) else Right(result)
 
     def unfold(
         self,
         *,
-        right: Callable[[Never], _T1] = lambda v: v,
-        left: Callable[[_Bad], _T2] = lambda w: w,
-        nothing: Callable[[], _T3] = lambda: None
+        right: Callable[[Never], _T1] = _identity,
+        left: Callable[[_Bad], _T2] = _identity,
+        nothing: Callable[[], _T3] = _none
     ) -> _T2:
         """
             Applies a sync function without wrapping the result. As a rule, it completes the chain.
             :raises MonadError: violation of the contract by 'left'.
         """
-        _panic_on_bad_function(left, monad=self.__class__.__name__, method='unfold')
+        if left is _identity:
+            return self._value
+        _panic_on_bad_function(left, monad=self._MONAD_NAME, method='unfold')
         return left(self._value)
 
     def ap(self, wrapped_val: Triple[_T1, _NewBad]) -> 'Left[_Bad]':
@@ -276,33 +301,27 @@ class Left(Triple[Never, _Bad], Generic[_Bad]):
 
 
 class Nothing(Triple[Never, Never]):
-    """A branch for an empty result"""
-
-    __slots__ = []
+    """A branch for an empty result - a single instance, like None"""
 
-    @property
-    def value(self) -> None:
-        return None
+    __slots__ = ["__weakref__"]
 
-    @property
-    def is_right(self) -> bool:
-        return False
+    is_right = False
+    is_nothing = True
 
-    @property
-    def is_nothing(self) -> bool:
-        return True
+    _instance: ClassVar[Optional['Nothing']] = None
 
-    def map(self, fn: Callable[[Never], _NewOk]) -> 'Nothing':
-        return self
+    def __new__(cls):
+        instance = cls.__dict__.get('_instance')  # own instance of the class, not inherited from the parent
+        if instance is None:
+            instance = super().__new__(cls)
+            cls._instance = instance
+        return instance
 
-    def bind(self, fn: Callable[[Never], Triple[_NewOk, _NewBad]]) -> 'Nothing':
-        return self
+    @property
+    def value(self) -> None:
+        return None
 
-    def recover_from_left(
-        self,
-        fn: Callable[[Never], Union[Triple[_NewOk, _NewBad], _NewOk]]
-    ) -> 'Nothing':
-        return self
+    map = bind = recover_from_left = _skip
 
     def recover_from_nothing(
         self,
@@ -313,22 +332,24 @@ class Nothing(Triple[Never, Never]):
            Combines the logic of map and bind, wrapping simple values in a Triple.
            :raises MonadError: violation of the contract.
         """
-        _panic_on_bad_function(fn, monad=self.__class__.__name__, method='recover_from_nothing')
+        _panic_on_bad_function(fn, monad=self._MONAD_NAME, method='recover_from_nothing')
         result = fn()
-        return result if isinstance(result, Triple) else Right(result)
+        return result if result.__class__ in _TRIPLE_TYPES or isinstance(result, Triple) else Right(result)
 
     def unfold(
         self,
         *,
-        right: Callable[[Never], _T1] = lambda v: v,
-        left: Callable[[Never], _T2] = lambda w: w,
-        nothing: Callable[[], _T3] = lambda: None
+        right: Callable[[Never], _T1] = _identity,
+        left: Callable[[Never], _T2] = _identity,
+        nothing: Callable[[], _T3] = _none
     ) -> _T3:
         """
             Applies a sync function without wrapping the result. As a rule, it completes the chain.
             :raises MonadError: violation of the contract by 'nothing'.
         """
-        _panic_on_bad_function(nothing, monad=self.__class__.__name__, method='unfold')
+        if nothing is _none:
+            return None
+        _panic_on_bad_function(nothing, monad=self._MONAD_NAME, method='unfold')
         return nothing()
 
     def ap(self, wrapped_val: Triple[_T1, _NewBad]) -> 'Nothing':
@@ -341,76 +362,146 @@ class Nothing(Triple[Never, Never]):
         return f"Nothing()"
 
 
+_NOTHING = Nothing()  # the single instance - without the '__new__' call in the module functions
+
+# the exact classes are checked first - 'isinstance' against the ABC is only for the rest
+_TRIPLE_TYPES = frozenset((Right, Left, Nothing))
+_BAD_TYPES = frozenset((Left, Nothing))
+
+
 Params = ParamSpec('Params')
 
 
-class TUtils:
-    """Several useful auxiliary functions - static methods"""
-
-    @staticmethod
-    def of(value: _Ok) -> Right[_Ok]:
-        """Wraps a non-Triple value in a Right container"""
-        return Right(value)
-
-    @staticmethod
-    def from_nullable(
-        value: _Ok,
-        predicate: Callable[[_Ok], bool] = lambda v: v is not None
-    ) -> Union[Right[_Ok], Nothing]:
-        """Wraps a non-Triple value in a Right container if the predicate returns true, otherwise - Nothing"""
-        return Right(value) if predicate(value) else Nothing()
-
-    @staticmethod
-    def from_try(fn: Callable[Params, _Ok]) -> Callable[Params, Union[Right[_Ok], Left[Exception]]]:
-        """
-           Performs a sync function, catching possible errors - heirs of 'Exception'.
-           MonadError is not suppressed.
-           :raises MonadError: violation of the synchronicity of the function.
-        """
-        _panic_on_bad_function(fn, monad=TUtils.__name__, method='from_try')
-
-        def from_try_inner(*args: Params.args, **kwargs: Params.kwargs) -> Union[Right[_Ok], Left[Exception]]:
-            try:
-                result: _Ok = fn(*args, **kwargs)
-                return Right(result)
-            except Exception as err:
-                if isinstance(err, MonadError):
-                    raise err
-                return Left(err)
-
-        return wraps(fn)(from_try_inner)
-
-    @staticmethod
-    def lift(curried, *wrapped_args: Triple):
-        """Applies Triple-wrapped positional arguments to a curried function(not wrapped) through 'ap' method"""
-        result = Right(curried)
-        for arg in wrapped_args:
-            result = result.ap(arg)
-        return result
-
-    @staticmethod
-    def is_triple(value) -> bool:
-        """Check for Triple entity"""
-        return isinstance(value, Triple)
-
-    @staticmethod
-    def is_bad(value) -> bool:
-        """Check for bad Triple entity"""
-        return isinstance(value, Triple) and not value.is_right
-
-    @staticmethod
-    def closer(func: Callable[..., _Ok]) -> Callable[..., Union[Left, Nothing, _Ok]]:
-        """Sync decorator - if one of the arguments is a "bad" Triple entity, it immediately returns it.
-           Otherwise, it calls the function with the passed arguments, automatically unwraps "good" Triple entities.
-        """
-        def closer_wrapper(*args, **kwargs) -> Union[Left, Nothing, _Ok]:
-            for arg in args:
-                if TUtils.is_bad(arg):
+def of(value: _Ok) -> Right[_Ok]:
+    """Wraps a non-Triple value in a Right container"""
+    return Right(value)
+
+
+def _not_none(value) -> bool:
+    """Default predicate of 'from_nullable' - checked inline, without a call"""
+    return value is not None
+
+
+def from_nullable(
+    value: _Ok,
+    predicate: Callable[[_Ok], bool] = _not_none
+) -> Union[Right[_Ok], Nothing]:
+    """Wraps a non-Triple value in a Right container if the predicate returns true, otherwise - Nothing"""
+    if predicate is _not_none:
+        return Right(value) if value is not None else _NOTHING
+    return Right(value) if predicate(value) else _NOTHING
+
+
+def from_try(fn: Callable[Params, _Ok]) -> Callable[Params, Union[Right[_Ok], Left[Exception]]]:
+    """
+       Performs a sync function, catching possible errors - heirs of 'Exception'.
+       MonadError is not suppressed.
+       :raises MonadError: violation of the synchronicity of the function.
+    """
+    _panic_on_bad_function(fn, monad='TUtils', method='from_try')
+
+    def from_try_inner(*args: Params.args, **kwargs: Params.kwargs) -> Union[Right[_Ok], Left[Exception]]:
+        try:
+            result: _Ok = fn(*args, **kwargs)
+            return Right(result)
+        except Exception as err:
+            if isinstance(err, MonadError):
+                raise err
+            return Left(err)
+
+    return _wraps(from_try_inner, fn)
+
+
+def lift(curried, *wrapped_args: Triple):
+    """Applies Triple-wrapped positional arguments to a curried function(not wrapped) through 'ap' method"""
+    # the same steps as 'Right.ap' inlined - without a new Right for every intermediate function
+    fn = curried
+    for index, arg in enumerate(wrapped_args):
+        _panic_on_bad_function(fn, monad=Right._MONAD_NAME, method='ap')
+        if arg.__class__ is Right:
+            val = arg._value
+        elif not arg.is_right:
+            return arg
+        else:
+            val = arg.value
+        result = fn(val)
+        cls = result.__class__
+        if cls is Right:
+            fn = result._value
+        elif cls in _BAD_TYPES:
+            return result
+        elif isinstance(result, Triple):  # heirs of the abstract class continue with their own 'ap'
+            for rest in wrapped_args[index + 1:]:
+                result = result.ap(rest)
+            return result
+        else:
+            fn = result
+    return Right(fn)
+
+
+def is_triple(value) -> bool:
+    """Check for Triple entity"""
+    return value.__class__ in _TRIPLE_TYPES or isinstance(value, Triple)
+
+
+def is_bad(value) -> bool:
+    """Check for bad Triple entity"""
+    cls = value.__class__
+    if cls in _BAD_TYPES:
+        return True
+    if cls is Right:
+        return False
+    return isinstance(value, Triple) and not value.is_right
+
+
+def closer(func: Callable[..., _Ok]) -> Callable[..., Union[Left, Nothing, _Ok]]:
+    """Sync decorator - if one of the arguments is a "bad" Triple entity, it immediately returns it.
+       Otherwise, it calls the function with the passed arguments, automatically unwraps "good" Triple entities.
+    """
+    right_cls, bad_types = Right, _BAD_TYPES  # closure cells instead of module globals in the wrapper
+
+    def closer_wrapper(*args, **kwargs) -> Union[Left, Nothing, _Ok]:
+        # a single pass over the arguments - checking and unwrapping together
+        unwrapped_pos = []
+        for arg in args:
+            cls = arg.__class__
+            if cls is right_cls:
+                arg = arg._value
+            elif cls in bad_types:
+                return arg
+            elif isinstance(arg, Triple):
+                if not arg.is_right:
                     return arg
-            for arg in kwargs.values():
-                if TUtils.is_bad(arg):
+                arg = arg.value
+            unwrapped_pos.append(arg)
+        unwrapped_named = dict()
+        for nm, arg in kwargs.items():
+            cls = arg.__class__
+            if cls is right_cls:
+                arg = arg._value
+            elif cls in bad_types:
+                return arg
+            elif isinstance(arg, Triple):
+                if not arg.is_right:
                     return arg
-            unwrapped_pos = [getattr(arg, 'value') if isinstance(arg, Triple) else arg for arg in args]
-            unwrapped_named = {nm: getattr(v, 'value') if isinstance(v, Triple) else v for nm, v in kwargs.items()}
-            return func(*unwrapped_pos, **unwrapped_named)
-        return wraps(func)(closer_wrapper)
+                arg = arg.value
+            unwrapped_named[nm] = arg
+        return func(*unwrapped_pos, **unwrapped_named)
+
+    arity = specs.closer_arity(func)
+    if arity is not None:  # the checks are unrolled for the usual call, the rest go to the generic wrapper
+        make = specs.closer_factory(arity)
+        return _wraps(make(func, closer_wrapper, right_cls, bad_types, Triple, isinstance), func)
+    return _wraps(closer_wrapper, func)
+
+
+class TUtils:
+    """Several useful auxiliary functions - static methods, the same as the module-level functions"""
+
+    of = staticmethod(of)
+    from_nullable = staticmethod(from_nullable)
+    from_try = staticmethod(from_try)
+    lift = staticmethod(lift)
+    is_triple = staticmethod(is_triple)
+    is_bad = staticmethod(is_bad)
+    closer = staticmethod(closer)
@@ -1,8 +1,11 @@
+# The curried steps are built from arbitrary Python callables, defaults and *args/**kwargs - object graphs,
+# not numeric loops. A JIT like Numba can not compile them, the speed comes from the plain CPython means.
 import unittest
 from inspect import iscoroutine
 import asyncio
+from unittest.mock import patch
 
-from mafunca.common.exceptions import CurryBadArguments
+from mafunca.common.exceptions import CurryBadArguments, CurryBadFunctionError
 from mafunca.curry import curry2, curry3, curry4, curry
 
 
@@ -42,11 +45,16 @@ class TestCurry(unittest.TestCase):
         def for_curry(a: int, b: int, c: int = 0, d: int = 0) -> list[int]:
             return [a, b, c, d]
 
-        self.assertEqual(for_curry(1)(2)(3)(4), [1, 2, 3, 4])
-        self.assertEqual(for_curry(1)(2)(), [1, 2, 0, 0])
-        self.assertEqual(for_curry()(b=2, a=1), [1, 2, 0, 0])
-        self.assertEqual(for_curry(1, 2)(c=3)(), [1, 2, 3, 0])
-        self.assertEqual(for_curry(1, 2)(d=3)(), [1, 2, 0, 3])
+        cases = [
+            ('one by one', lambda: for_curry(1)(2)(3)(4), [1, 2, 3, 4]),
+            ('defaults', lambda: for_curry(1)(2)(), [1, 2, 0, 0]),
+            ('named', lambda: for_curry()(b=2, a=1), [1, 2, 0, 0]),
+            ('default d', lambda: for_curry(1, 2)(c=3)(), [1, 2, 3, 0]),
+            ('default c', lambda: for_curry(1, 2)(d=3)(), [1, 2, 0, 3]),
+        ]
+        for name, apply, expected in cases:
+            with self.subTest(name):
+                self.assertEqual(apply(), expected)
 
     def test_curry_variant_args(self):
         @curry
@@ -91,6 +99,58 @@ class TestCurry(unittest.TestCase):
             for_curry(c=1)
         self.assertEqual(for_curry(1)(b=2), 3)
 
+    def test_curry_named_before_positional(self):
+        @curry
+        def for_curry(a: int, b: int, c: int = 0, d: int = 0) -> list[int]:
+            return [a, b, c, d]
+
+        self.assertEqual(for_curry(b=2)(1, 3)(), [1, 2, 3, 0])
+        self.assertEqual(for_curry(c=3)(1)(2, 4), [1, 2, 3, 4])
+        with self.assertRaises(CurryBadArguments):
+            for_curry(1, 2, 3, 4, 5)
+        with self.assertRaises(CurryBadArguments):
+            for_curry(1)(a=1)
+
+    def test_curry_without_arguments(self):
+        @curry
+        def for_curry(a: int, b: int, *args) -> list:
+            return [a, b, args]
+
+        self.assertIs(for_curry(), for_curry)
+        step = for_curry(1)
+        self.assertIs(step(), step)
+        self.assertEqual(step()(2)()(3), [1, 2, (3,)])
+
+        self.assertEqual(curry(lambda: 1)(), 1)
+
+    def test_curry_step_looks_like_function(self):
+        def for_curry(a: int, b: int, c: int = 0) -> int:
+            """Sum of the arguments"""
+            return a + b + c
+
+        step = curry(for_curry)(1)
+        self.assertEqual(step.__name__, 'for_curry')
+        self.assertEqual(step.__doc__, 'Sum of the arguments')
+        self.assertIs(step.__wrapped__, for_curry)
+
+        class Holder:
+            method = curry(lambda self, a, b: [self.__class__.__name__, a, b])
+
+        self.assertEqual(Holder().method(1)(2), ['Holder', 1, 2])
+
+    def test_curry_signature_introspected_once(self):
+        def for_curry(a, b, c=0):
+            return a + b + c
+
+        curried = curry(for_curry)
+        with patch('mafunca.curry.inspect.signature') as signature:
+            self.assertEqual(curried(1)(2)(), 3)
+            self.assertEqual(curry(for_curry)(1, 2, 3), 6)
+            signature.assert_not_called()
+
+        with self.assertRaises(CurryBadFunctionError):
+            curry(dict)  # no signature for some built-in types
+
 
 class TestAsyncCurry(unittest.IsolatedAsyncioTestCase):
     async def test_async_curry_basic(self):
@@ -27,6 +27,40 @@ class TestEff(unittest.IsolatedAsyncioTestCase):
         eff = Eff.of(5).bind(multiply)
         self.assertEqual(await eff.run(), 15)
 
+    async def test_sync_function_returning_awaitable(self):
+        async def plus(x):
+            return x + 1
+
+        eff = Eff(lambda: plus(0)).map(lambda x: plus(x)).bind(lambda x: Eff(lambda: plus(x)))
+        self.assertEqual(await eff.run(), 3)
+
+        eff = Eff(lambda: plus(0)).ensure(lambda: plus(0))
+        self.assertEqual(await eff.run(), 1)
+
+        def future(x):
+            fut = asyncio.get_running_loop().create_future()
+            fut.set_result(x + 1)
+            return fut
+
+        eff = Eff(lambda: future(0)).map(future).map(lambda x: [x])
+        self.assertEqual(await eff.run(), [2])
+
+    async def test_async_chain(self):
+        async def start():
+            return 1
+
+        async def plus(x):
+            return x + 1
+
+        async def plus_eff(x):
+            return Eff(lambda: plus(x))
+
+        eff = Eff(start).map(plus).bind(plus_eff).map(lambda x: x * 10).bind(lambda x: Eff.of(x + 1))
+        self.assertEqual(await eff.run(), 31)
+
+        eff = Eff(start).map(lambda _: Left('err')).map(plus).bind(plus_eff)
+        self.assertIsInstance(await eff.run(), Left)
+
     async def test_short_circuit(self):
         eff = Eff(lambda: Left('err')).map(lambda x: x + 10)
         result = await eff.run()
@@ -46,6 +80,36 @@ class TestEff(unittest.IsolatedAsyncioTestCase):
         result = await eff.run()
         self.assertIsInstance(result, Nothing)
 
+    async def test_of_bad_value(self):
+        eff = Eff.of(Left('err')).map(lambda x: x + 10).bind(lambda x: Eff.of(x + 1))
+        result = await eff.run()
+        self.assertIsInstance(result, Left)
+
+        eff = Eff.of(Nothing()).map_to_thread(lambda x: x + 10).bind_to_thread(lambda x: Eff.of(x + 1))
+        result = await eff.run()
+        self.assertIsInstance(result, Nothing)
+
+    async def test_fused_maps(self):
+        async def plus(x):
+            return x + 1
+
+        eff = Eff.of(0)
+        for _ in range(5000):  # deeper than the recursion limit for nested steps
+            eff = eff.map(lambda x: x + 1).map(plus)
+        self.assertEqual(await eff.run(), 10000)
+
+        base = Eff.of(1).map(lambda x: x + 1)
+        self.assertEqual(await base.map(lambda x: x * 10).run(), 20)
+        self.assertEqual(await base.map(lambda x: x - 10).run(), -8)
+        self.assertEqual(await base.run(), 2)
+
+        eff = Eff.of(1).map(lambda _: Left('err')).map(lambda x: x + 1).map(lambda x: x + 1)
+        self.assertIsInstance(await eff.run(), Left)
+
+        eff = Eff.of(1).map(lambda x: x + 1).map(lambda x: Eff.of(x)).map(lambda x: x + 1)
+        with self.assertRaises(MonadError):
+            await eff.run()
+
     async def test_violation(self):
         eff = Eff.of(1).map(lambda x: Eff.of(x))
         with self.assertRaises(MonadError):
@@ -55,6 +119,27 @@ class TestEff(unittest.IsolatedAsyncioTestCase):
         with self.assertRaises(MonadError):
             await eff.run()
 
+    async def test_violation_annotated(self):
+        def to_list(x) -> list:
+            return [x]
+
+        def to_object(x) -> object:
+            return Eff.of(x)
+
+        def to_eff(x) -> Eff:
+            return Eff.of(x)
+
+        self.assertEqual(await Eff.of(1).map(to_list).map(to_list).run(), [[1]])
+        self.assertEqual(await Eff.of(1).map_to_thread(to_list).run(), [1])
+        for fn in (to_object, to_eff):
+            with self.subTest(fn=fn.__name__):
+                with self.assertRaises(MonadError):
+                    await Eff.of(1).map(fn).run()
+                with self.assertRaises(MonadError):
+                    await Eff.of(1).map(to_list).map(fn).run()
+                with self.assertRaises(MonadError):
+                    await Eff.of(1).map_to_thread(fn).run()
+
     async def test_to_thread_violation(self):
         async def violate_sync(x):
             return x + 1
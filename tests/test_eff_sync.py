@@ -1,3 +1,4 @@
+# EffSync chains are lambdas with dynamic types run by the trampoline - not a target for a numeric JIT (Numba).
 import unittest
 
 from mafunca.common.exceptions import MonadError
@@ -38,6 +39,13 @@ class TestEffSync(unittest.TestCase):
         self.assertEqual(eff.run().get_or_else("There was a Nothing"), "There was a Nothing")
         self.assertTrue(eff.run().is_nothing)
 
+    def test_of_bad_value(self):
+        eff = EffSync.of(Left('error')).map(lambda x: x + 1).bind(lambda x: EffSync(lambda: x + 1))
+        self.assertEqual(eff.run().unfold(left=lambda x: (x,)), ('error',))
+
+        eff = EffSync.of(Nothing()).map(lambda x: x + 1)
+        self.assertTrue(eff.run().is_nothing)
+
     def test_catch_errors(self):
         def error_raiser():
             raise TypeError
@@ -88,6 +96,100 @@ class TestEffSync(unittest.TestCase):
         )
         self.assertTrue(eff.run().is_nothing)
 
+    def test_transform_with(self):
+        def error_raiser():
+            raise TypeError
+
+        eff = (
+            EffSync.of(0)
+            .map(lambda _: error_raiser())
+            .transform_with(lambda x: EffSync(lambda: x + 9), lambda _: EffSync(lambda: -10))
+        )
+        self.assertEqual(eff.run(), -10)
+
+        eff = (
+            EffSync.of(0)
+            .map(lambda x: x + 1)
+            .transform_with(lambda x: EffSync(lambda: x + 9), lambda _: -10)
+            .map(lambda _: error_raiser())
+            .transform_with(lambda x: EffSync(lambda: x + 9), lambda _: 5)
+        )
+        self.assertEqual(eff.run(), 5)
+
+        # short circuit on bad Triple entities, errors of 'on_ok' are not intercepted
+        eff = EffSync(lambda: Nothing()).transform_with(lambda x: EffSync(lambda: x + 1), lambda _: 0)
+        self.assertTrue(eff.run().is_nothing)
+
+        eff = EffSync.of(0).transform_with(lambda _: EffSync(error_raiser), lambda _: 0)
+        with self.assertRaises(TypeError):
+            eff.run()
+
+        with self.assertRaises(MonadError):
+            EffSync.of(0).transform_with(lambda x: x + 1, lambda _: 0).run()
+
+    def test_redeem(self):
+        def error_raiser():
+            raise TypeError
+
+        eff = (
+            EffSync.of(0)
+            .map(lambda _: error_raiser())
+            .redeem(lambda _: Nothing(), lambda x: x + 1)
+            .map(lambda x: x + 1)
+        )
+        self.assertTrue(eff.run().is_nothing)
+
+        eff = EffSync.of(0).map(lambda x: x + 1).redeem(lambda _: -1, lambda x: x * 10).map(lambda x: x + 1)
+        self.assertEqual(eff.run(), 11)
+
+        eff = EffSync.of(0).redeem(lambda _: -1, lambda _: error_raiser()).catch(lambda _: 5)
+        self.assertEqual(eff.run(), 5)
+
+        with self.assertRaises(MonadError):
+            EffSync.of(0).redeem(lambda _: -1, lambda x: EffSync.of(x)).run()
+        with self.assertRaises(MonadError):
+            EffSync(error_raiser).redeem(lambda _: EffSync.of(-1), lambda x: x).catch(lambda _: 0).run()
+
+    def test_sequence(self):
+        log = []
+
+        def logged(value):
+            log.append(value)
+            return value
+
+        effs = [
+            EffSync.of(1),
+            EffSync.of(1).map(lambda x: x + 1),
+            EffSync(lambda: logged(3)).bind(lambda x: EffSync.of(x))
+        ]
+        seq = EffSync.sequence(effs)
+        self.assertEqual(seq.run(), [1, 2, 3])
+        self.assertEqual(seq.map(sum).run(), 6)
+        self.assertEqual(log, [3, 3])
+
+        seq = EffSync.sequence([EffSync.of(1), EffSync(lambda: Left('err')), EffSync(lambda: logged(4))])
+        self.assertEqual(seq.run().unfold(), 'err')
+        self.assertEqual(log, [3, 3])
+
+        self.assertEqual(EffSync.sequence([]).run(), [])
+        self.assertEqual(EffSync.sequence([EffSync(lambda: 1 / 0)]).catch(lambda _: 0).run(), 0)
+        with self.assertRaises(MonadError):
+            EffSync.sequence([EffSync.of(1), 2])
+
+    def test_compile(self):
+        calls = []
+        eff = EffSync(lambda: calls.append(0) or 1).map(lambda x: x + 1).bind(lambda x: EffSync.of(x * 10))
+        compiled = eff.compile()
+        self.assertEqual(compiled(), 20)
+        self.assertEqual(eff.run(), 20)
+        self.assertEqual(eff.map(lambda x: x + 1).run(), 21)
+        self.assertEqual(eff.run(), 20)
+        self.assertEqual(calls, [0, 0, 0, 0])
+
+        compiled = EffSync(lambda: 1 / 0).catch(lambda _: 0).compile()
+        self.assertEqual(compiled(), 0)
+        self.assertEqual(EffSync.of(5).compile()(), 5)
+
     def test_ensure(self):
         def error_raiser():
             raise TypeError
@@ -106,6 +208,70 @@ class TestEffSync(unittest.TestCase):
         self.assertEqual(eff.run(), 2)
         self.assertEqual(g, 20)
 
+        def ensure_raiser():
+            raise ValueError
+
+        log = []
+        base = EffSync(lambda: 0).ensure(lambda: log.append(1))
+        eff = base.ensure(ensure_raiser).ensure(lambda: log.append(2)).catch(lambda e: type(e).__name__)
+        self.assertEqual(eff.run(), 'ValueError')
+        self.assertEqual(log, [1, 2])
+        self.assertEqual(base.ensure(lambda: log.append(3)).run(), 0)
+        self.assertEqual(log, [1, 2, 1, 3])
+        with self.assertRaises(ValueError):
+            EffSync(lambda: error_raiser()).ensure(lambda: log.append(4)).ensure(ensure_raiser).run()
+        self.assertEqual(log, [1, 2, 1, 3, 4])
+
+        def raiser(err):
+            def inner():
+                raise err
+            return inner
+
+        eff = EffSync(lambda: 0).ensure(raiser(OSError())).ensure(raiser(KeyError())).ensure(raiser(ValueError()))
+        with self.assertRaises(ValueError) as ctx:
+            eff.run()
+        self.assertIsInstance(ctx.exception.__context__, KeyError)
+        self.assertIsInstance(ctx.exception.__context__.__context__, OSError)
+
+    def test_error_context(self):
+        def raiser(err):
+            def inner(*_):
+                raise err
+            return inner
+
+        eff = (
+            EffSync(raiser(RuntimeError('effect failed')))
+            .ensure(raiser(KeyError('cleanup failed')))
+            .map(lambda x: x)
+            .catch(raiser(ValueError('handler failed')))
+        )
+        with self.assertRaises(ValueError) as ctx:
+            eff.run()
+        self.assertIsInstance(ctx.exception.__context__, KeyError)
+        self.assertIsInstance(ctx.exception.__context__.__context__, RuntimeError)
+
+        eff = EffSync(raiser(RuntimeError('effect failed'))).catch(lambda _: EffSync(raiser(KeyError('retry failed'))))
+        with self.assertRaises(KeyError) as ctx:
+            eff.run()
+        self.assertIsInstance(ctx.exception.__context__, RuntimeError)
+
+    def test_deep_chain(self):
+        def error_raiser(x):
+            raise TypeError
+
+        calls = []
+        eff = EffSync.of(0)
+        for _ in range(5000):  # deeper than the recursion limit for nested effects
+            eff = eff.map(lambda x: x + 1).bind(lambda x: EffSync.of(x + 1))
+        self.assertEqual(eff.run(), 10000)
+        self.assertEqual(eff.effect(), 10000)
+
+        eff = eff.map(error_raiser)
+        for _ in range(5000):
+            eff = eff.map(lambda x: x + 1).ensure(lambda: calls.append(1))
+        self.assertEqual(eff.catch(lambda _: -1).run(), -1)
+        self.assertEqual(len(calls), 5000)
+
     def test_contract_violation(self):
         async def violated():
             return 1
@@ -119,6 +285,16 @@ class TestEffSync(unittest.TestCase):
         with self.assertRaises(MonadError):
             EffSync(lambda: 10).bind(lambda x: x + 1).run()
 
+        def to_list(x) -> list:
+            return [x]
+
+        def to_object(x) -> object:
+            return EffSync.of(x)
+
+        self.assertEqual(EffSync(lambda: 10).map(to_list).run(), [10])
+        with self.assertRaises(MonadError):
+            EffSync(lambda: 10).map(to_object).run()
+
 
 if __name__ == '__main__':
     unittest.main()
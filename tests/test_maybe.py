@@ -54,6 +54,9 @@ class TestMaybe(unittest.TestCase):
         self.assertTrue(res.is_nothing)
         self.assertEqual(res.get_or_else(100), 100)
 
+        self.assertIs(from_null()(None), from_null()(None))
+        self.assertEqual(from_null()(None), Nothing())
+
     def test_nullable_yield(self):
         res = (from_null(lambda v: v % 2 == 0)(i) for i in range(10))
         res = list((m for m in res if m.is_nothing))
@@ -0,0 +1,192 @@
+import unittest
+import weakref
+from dataclasses import dataclass
+
+import mafunca.common._panics as panics  # noqa
+from mafunca.common.exceptions import MonadError
+from mafunca.curry import curry
+from mafunca.triple import Right, Left, Nothing, TUtils, impure
+
+
+@dataclass
+class Add:
+    """A callable with the generated '__eq__' - unhashable, but supports weak references"""
+    step: int
+
+    def __call__(self, value):
+        return value + self.step
+
+
+@dataclass
+class Const:
+    """The same for the functions without parameters"""
+    value: int
+
+    def __call__(self):
+        return self.value
+
+
+class Op:
+    """A callable with the value-based equality"""
+    def __init__(self, step):
+        self.step = step
+
+    def __call__(self, value):
+        return value + self.step
+
+    def __eq__(self, other):
+        return isinstance(other, Op) and other.step == self.step
+
+    def __hash__(self):
+        return hash(self.step)
+
+
+class TestTriple(unittest.TestCase):
+    def test_unhashable_callable(self):
+        self.assertEqual(Right(1).map(Add(2)).unfold(), 3)
+        self.assertEqual(Right(1).bind(lambda x: Right(Add(2)(x))).unfold(), 3)
+        self.assertEqual(Right(1).bind(Add(2)), 3)
+        self.assertEqual(Left(1).recover_from_left(Add(2)).unfold(), 3)
+        self.assertEqual(Right(Add(2)).ap(Right(1)).unfold(), 3)
+        self.assertEqual(TUtils.from_try(Add(2))(1).unfold(), 3)
+
+    def test_unhashable_callable_unfold(self):
+        self.assertEqual(Right(1).unfold(right=Add(2)), 3)
+        self.assertEqual(Left(1).unfold(left=Add(2)), 3)
+        self.assertEqual(Nothing().unfold(nothing=Const(3)), 3)
+
+    def test_equal_callable_marked_impure(self):
+        pure = Op(1)
+        self.assertEqual(Right(1).map(pure).unfold(), 2)
+        with self.assertRaises(MonadError):
+            Right(1).map(impure(Op(1)))
+        self.assertEqual(Right(1).map(pure).unfold(), 2)
+
+    def test_fresh_lambdas_not_cached(self):
+        before = len(panics._FLAGS)
+        for step in range(100):
+            self.assertEqual(Right(step).map(lambda x: x + 1).unfold(), step + 1)
+        self.assertEqual(len(panics._FLAGS), before)
+
+        async def coro(x):
+            return x
+        with self.assertRaises(MonadError):
+            Right(1).map(coro)
+
+    def test_unhashable_callable_lift(self):
+        self.assertEqual(TUtils.lift(Add(2), Right(1)).unfold(), 3)
+
+    def test_closer(self):
+        @TUtils.closer
+        def summa(a, b, c):
+            return a + b + c
+
+        self.assertEqual(summa(Right(1), 2, Right(3)), 6)
+        err, err_b = Left('err'), Left('b')
+        self.assertIs(summa(err, Nothing(), 3), err)
+        self.assertIs(summa(1, Nothing(), err), Nothing())
+        self.assertEqual(summa(1, b=Right(2), c=3), 6)
+        self.assertIs(summa(c=err, a=1, b=err_b), err)
+        self.assertEqual(summa.__name__, 'summa')
+
+    def test_closer_arity_mismatch(self):
+        @TUtils.closer
+        def pair(a, b=0):
+            return [a, b]
+
+        err = Left(1)
+        self.assertIs(pair(err), err)
+        self.assertEqual(pair(Right(1)), [1, 0])
+        self.assertIs(pair(1, Nothing(), 3), Nothing())
+        with self.assertRaises(TypeError):
+            pair(1, 2, 3)
+
+        many = TUtils.closer(lambda *args: sum(args))
+        self.assertEqual(many(Right(1), 2, 3), 6)
+        self.assertIs(many(1, err), err)
+
+    def test_closer_parameter_names(self):
+        shadowing = TUtils.closer(lambda isinstance, _cls, _func: [isinstance, _cls, _func])
+        self.assertEqual(shadowing(5, Right(6), 7), [5, 6, 7])
+        self.assertIs(shadowing(5, 6, Nothing()), Nothing())
+
+        wide = TUtils.closer(lambda a, b, c, d, e, f, g, h, i: [a, i])  # more parameters than are unrolled
+        self.assertEqual(wide(Right(1), 2, 3, 4, 5, 6, 7, 8, Right(9)), [1, 9])
+        err = Left(9)
+        self.assertIs(wide(1, 2, 3, 4, 5, 6, 7, 8, err), err)
+
+    def test_lift(self):
+        @curry
+        def summa(a, b, c):
+            return a + b + c
+
+        self.assertEqual(TUtils.lift(summa, Right(1), Right(2), Right(3)).unfold(), 6)
+        err = Left('err')
+        self.assertIs(TUtils.lift(summa, Right(1), err, Nothing()), err)
+        self.assertIs(TUtils.lift(summa, Nothing(), err, Right(3)), Nothing())
+        self.assertIsInstance(TUtils.lift(summa, Right(1)), Right)
+
+    def test_lift_bad_intermediate_result(self):
+        err = Left('step')
+        calls = []
+
+        @curry
+        def summa(a, b):
+            calls.append(b)
+            return a + b
+
+        self.assertIs(TUtils.lift(lambda a: err, Right(1), Right(2)), err)
+        self.assertIs(TUtils.lift(lambda a: Nothing(), Right(1), Left('later')), Nothing())
+        self.assertEqual(TUtils.lift(lambda a: Right(summa(a)), Right(1), Right(2)).unfold(), 3)
+        self.assertEqual(calls, [2])
+
+    def test_lift_triple_heir(self):
+        class Tagged(Right):
+            pass
+
+        @curry
+        def summa(a, b, c):
+            return a + b + c
+
+        # an heir returned by the function continues through its own 'ap'
+        result = TUtils.lift(lambda a: Tagged(summa(a)), Right(1), Tagged(2), Right(3))
+        self.assertEqual(result.unfold(), 6)
+        err = Left('err')
+        self.assertIs(TUtils.lift(lambda a: Tagged(summa(a)), Right(1), err, Right(3)), err)
+        self.assertEqual(TUtils.lift(summa, Tagged(1), Tagged(2), Tagged(3)).unfold(), 6)
+
+    def test_nothing_single_instance(self):
+        self.assertIs(Nothing(), Nothing())
+        self.assertIs(Nothing().map(lambda x: x + 1).bind(lambda x: Right(x)), Nothing())
+        self.assertIs(TUtils.from_nullable(None), Nothing())
+
+    def test_weak_references(self):
+        for entity in (Right(1), Left(1), Nothing()):
+            self.assertIs(weakref.ref(entity)(), entity)
+            self.assertFalse(hasattr(entity, '__dict__'))
+
+    def test_from_nullable(self):
+        self.assertEqual(TUtils.from_nullable(1).unfold(), 1)
+        self.assertIs(TUtils.from_nullable(None), Nothing())
+        self.assertEqual(TUtils.from_nullable(0).unfold(), 0)
+        self.assertEqual(TUtils.from_nullable(None, predicate=lambda v: v is None).unfold(), None)
+        self.assertIs(TUtils.from_nullable({'a': 1}, predicate=lambda d: d.get('b')), Nothing())
+        self.assertTrue(TUtils.from_nullable({'a': 1}, predicate=lambda d: d.get('a')).is_right)
+
+    def test_pattern_matching(self):
+        def describe(value):
+            match value:
+                case Right(inner):
+                    return ['right', inner]
+                case Left(error):
+                    return ['left', error]
+                case Nothing():
+                    return ['nothing']
+
+        self.assertEqual(describe(Right(1)), ['right', 1])
+        self.assertEqual(describe(Left('err')), ['left', 'err'])
+        self.assertEqual(describe(Nothing()), ['nothing'])
+
+
+if __name__ == "__main__":
+    unittest.main()